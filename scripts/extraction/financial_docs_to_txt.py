@@ -8,11 +8,18 @@ For M-Pesa statements, extracts SUMMARY section.
 For other documents, extracts first and last two pages focusing on totals, revenue, assets, profit/loss.
 """
 
+import argparse
 import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from tqdm import tqdm
-from utils import extract_pdf_text, discover_counties_and_applications, extract_application_id_from_folder_name
+from utils import (
+    extract_pdf_text,
+    discover_counties_and_applications,
+    extract_application_id_from_folder_name,
+    init_extraction_worker,
+)
 from utils_financial import (
     classify_financial_document,
     extract_first_and_last_pages,
@@ -94,9 +101,28 @@ Extraction Date: {Path(__file__).stat().st_mtime}
         print(f"❌ Error processing {pdf_path.name}: {str(e)}")
         return False
 
-def process_all_counties():
+def process_financial_document_task(task):
+    """
+    Worker entry point for the process pool.
+    Takes a (pdf_path, output_dir, county_name, app_id, doc_type) tuple and returns (county_name, success).
+    """
+    pdf_path, output_dir, county_name, app_id, doc_type = task
+    return county_name, extract_financial_document(pdf_path, output_dir, county_name, app_id, doc_type)
+
+def run_financial_document_tasks(tasks, jobs):
+    """Yield process_financial_document_task results in task order, using a process pool unless jobs is 1."""
+    if jobs <= 1:
+        yield from map(process_financial_document_task, tasks)
+        return
+
+    # Workers run OCR pages concurrently, so each tesseract is kept to one OpenMP thread
+    with ProcessPoolExecutor(max_workers=jobs, initializer=init_extraction_worker) as executor:
+        yield from executor.map(process_financial_document_task, tasks)
+
+def process_all_counties(jobs=1):
     """
     Process all counties and extract financial documents to TXT files.
+    Documents are extracted in `jobs` worker processes; each one writes its own TXT file.
     """
     print("KJET Financial Documents Extraction")
     print("=" * 50)
@@ -122,12 +148,11 @@ def process_all_counties():
     print(f"Found {len(counties_data)} counties with {total_applications} total applications")
     print()
 
-    # Process each county
-    for county_name, application_folders in tqdm(counties_data.items(), desc="Processing counties"):
+    # Collect the financial documents of every county first, then extract them in parallel
+    tasks = []
+    county_stats = {}
+    for county_name, application_folders in tqdm(counties_data.items(), desc="Discovering documents"):
         county_output_dir = output_base_dir / county_name / "financials"
-        county_docs_processed = 0
-        county_docs_success = 0
-        county_docs_failed = 0
 
         if not application_folders:
             print(f"⚪ {county_name}: No applications found")
@@ -148,26 +173,26 @@ def process_all_counties():
                 print(f"⚠️  {county_name}/{app_id}: No financial documents found")
                 continue
 
-            # Process each financial document
             for pdf_path, doc_type in financial_docs:
-                total_docs_processed += 1
-                county_docs_processed += 1
-
-                success = extract_financial_document(
-                    pdf_path, county_output_dir, county_name, app_id, doc_type
-                )
-
-                if success:
-                    total_docs_success += 1
-                    county_docs_success += 1
-                else:
-                    total_docs_failed += 1
-                    county_docs_failed += 1
+                tasks.append((pdf_path, county_output_dir, county_name, app_id, doc_type))
+
+    # Process each financial document (one process per job)
+    for county_name, success in tqdm(run_financial_document_tasks(tasks, jobs), total=len(tasks),
+                                     desc="Processing documents"):
+        stats = county_stats.setdefault(county_name, {"processed": 0, "success": 0})
+        total_docs_processed += 1
+        stats["processed"] += 1
+
+        if success:
+            total_docs_success += 1
+            stats["success"] += 1
+        else:
+            total_docs_failed += 1
 
-        # Print county summary
-        if county_docs_processed > 0:
-            success_rate = (county_docs_success / county_docs_processed) * 100
-            print(f"📊 {county_name}: {county_docs_success}/{county_docs_processed} financial documents extracted ({success_rate:.1f}%)")
+    # Print county summaries
+    for county_name, stats in county_stats.items():
+        success_rate = (stats["success"] / stats["processed"]) * 100
+        print(f"📊 {county_name}: {stats['success']}/{stats['processed']} financial documents extracted ({success_rate:.1f}%)")
 
     # Print final summary
     print()
@@ -201,6 +226,17 @@ def process_all_counties():
                 for doc_type, count in sorted(doc_types.items()):
                     print(f"    📄 {doc_type.replace('_', ' ').title()}: {count} files")
 
+def parse_args():
+    parser = argparse.ArgumentParser(description="Extract financial documents into TXT files per county")
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of worker processes for PDF extraction and OCR (1 runs serially in this process)",
+    )
+    return parser.parse_args()
+
 # Example usage
 if __name__ == "__main__":
-    process_all_counties()
\ No newline at end of file
+    args = parse_args()
+    process_all_counties(args.jobs)
\ No newline at end of file
@@ -1,12 +1,21 @@
 import argparse
 import csv
+import functools
+import hashlib
+import io
+import itertools
+import operator
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from decimal import Decimal
 from pathlib import Path
 from tqdm import tqdm
+import utils
 from utils import extract_pdf_text, discover_counties_and_applications, extract_application_id_from_folder_name
 
 # Global consistent column order for all CSV operations
-COLUMN_ORDER = [
+COLUMN_ORDER = (
     "app_id", "app_number", "cluster_name", "registration_status",
     "registration_status_other", "registration_number", "county",
     "constituency", "ward", "location", "phone_number", "alternate_phone",
@@ -25,129 +34,296 @@ COLUMN_ORDER = [
     "sales_domestic_b2c_percent", "b2c_description", "exports_percent",
     "exports_description", "marketing_expansion_plan", "problem_statement",
     "sustainable_practices", "submitted_at"
-]
-
+)
+
+# Legacy form question numbers mapped to their snake_case column names
+QUESTION_COLUMN_MAPPING = {
+    1: "app_id",
+    2: "app_number",
+    3: "cluster_name",
+    4: "registration_status",
+    5: "registration_status_other",
+    6: "registration_number",
+    7: "county",
+    8: "constituency",
+    9: "ward",
+    10: "location",
+    11: "phone_number",
+    12: "alternate_phone",
+    13: "email",
+    14: "chairperson",
+    15: "secretary",
+    16: "ceo",
+    17: "director",
+    18: "manager",
+    19: "treasurer",
+    20: "woman_owned_enterprise",
+    21: "woman_owned_explanation",
+    22: "place_of_operation",
+    23: "place_of_operation_other",
+    24: "place_of_operation_name",
+    25: "members_2022",
+    26: "members_2023",
+    27: "members_2024",
+    28: "employees_2022",
+    29: "employees_2023",
+    30: "employees_2024",
+    31: "members_male",
+    32: "members_female",
+    33: "members_age_18_35",
+    34: "members_age_36_50",
+    35: "members_age_above_50",
+    36: "value_chain",
+    37: "value_chain_other",
+    38: "economic_activities_description",
+    39: "turnover_2022",
+    40: "net_profit_2022",
+    41: "turnover_2023",
+    42: "net_profit_2023",
+    43: "turnover_2024",
+    44: "net_profit_2024",
+    45: "business_objectives",
+    46: "main_competitors",
+    47: "success_factors",
+    48: "critical_equipment_investment_plans",
+    49: "price_cost_margins",
+    50: "accounting_package",
+    51: "accounting_package_other",
+    52: "backward_linkages",
+    53: "ecommerce_channels",
+    54: "sales_domestic_b2b_percent",
+    55: "b2b_description",
+    56: "sales_domestic_b2c_percent",
+    57: "b2c_description",
+    58: "exports_percent",
+    59: "exports_description",
+    60: "marketing_expansion_plan",
+    61: "problem_statement",
+    62: "sustainable_practices",
+    63: "submitted_at"
+}
+
+# Runs of whitespace, collapsed to a single space when normalizing extracted text
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+# Matches a question number marker such as "12. " at the start of the text or after whitespace
+QUESTION_MARKER_PATTERN = re.compile(r'(?:^|(?<=\s))(\d{1,2})\.\s+')
+
+# Legacy page headers and encoding artifacts left by PDF extraction, replaced in a single pass
+TEXT_CLEANUP_REPLACEMENTS = {
+    'Application Details\n': '',
+    'Application Details': '',
+    'â€¢': '•',
+    'â€™': "'",
+    '&amp;': '&',
+}
+TEXT_CLEANUP_PATTERN = re.compile('|'.join(re.escape(token) for token in TEXT_CLEANUP_REPLACEMENTS))
+
+# Form labels that get captured in place of a real answer when a legacy question was left blank
+REJECTED_ANSWERS = frozenset({
+    'Business Objectives', 'Main Competitors', 'Success Factors',
+    'Other Value Chain', 'Other Accounting Package', 'Private_Premise',
+})
+
+
+def is_placeholder_answer(answer):
+    """Return True when an extracted legacy answer is empty, a question, or a bare form label."""
+    return len(answer) < 2 or answer.endswith('?') or answer in REJECTED_ANSWERS
+
+# Builds a row tuple in COLUMN_ORDER from an extracted data dict (both parsers fill every column)
+ROW_GETTER = operator.itemgetter(*COLUMN_ORDER)
+
+# "12. Question text" lines in questions.txt
+QUESTION_LINE_PATTERN = re.compile(r'^(\d+)\. (.+)$')
+
+
+@functools.lru_cache(maxsize=None)
 def load_questions():
-    """Load questions from questions.txt file."""
+    """Load questions from questions.txt file (parsed once per process)."""
     questions_file = Path(__file__).parent / "questions.txt"
     questions = {}
 
     if questions_file.exists():
         with open(questions_file, 'r', encoding='utf-8') as f:
             for line in f:
-                line = line.strip()
-                if line and '. ' in line:
-                    try:
-                        num_str, question = line.split('. ', 1)
-                        num = int(num_str)
-                        questions[num] = question
-                    except ValueError:
-                        continue
+                match = QUESTION_LINE_PATTERN.match(line.strip())
+                if match:
+                    questions[int(match.group(1))] = match.group(2)
 
     return questions
 
 
+# Form prompt text that Cohort 2 answers sometimes capture, removed case-insensitively after extraction
+PROMPTS_TO_REMOVE = {
+    "business_objectives": "Please specify the targets and how they are reviewed: (200 words or less)",
+    "main_competitors": "(If this differs by product/sales channel, please specify): (200 words or less)",
+    "success_factors": "What makes your organization unique versus competitors?: (200 words or less)",
+    "backward_linkages": "current suppliers of raw materials. Specify the main items your organization procures. For each item, indicate: Whether it is locally sourced or imported, Whether it is procured from large firms, MSMEs, cooperatives, or other types of suppliers, Any notable challenges or dependencies in your supply chain: (200 words or less)",
+    "marketing_expansion_plan": "Please describe the markets you aim to grow in, the reasons for targeting them, and your strategies for achieving this growth. Include details such as: Customer outreach methods, Operational enhancements, Planned investments, Progress made so far (e.g., discussions or MOUs with potential customers): (200 words or less)",
+    "problem_statement": "and the specific needs to be addressed. Highlight areas where project Business Development Services support could be beneficial: (200 words or less)",
+    "sustainable_practices": "Sustainable practices refer to environmentally friendly initiatives or actions taken by your cluster to minimize negative impacts on the environment and impacts from the environment (e.g., resilience to drought). Please",
+}
+
+PROMPT_CLEANUP_PATTERNS = {
+    field: re.compile(re.escape(prompt) + r"[\s\n]*", re.IGNORECASE)
+    for field, prompt in PROMPTS_TO_REMOVE.items()
+}
+
+# "Cohort:" label (and its common "Chort:" misspelling) trailing the submission date
+COHORT_LABEL_PATTERN = re.compile(r"Co?hort:")
+
+# Cohort 2 forms carry one marker from each group; a single scan finds them all
+COHORT2_MARKER_PATTERN = re.compile(
+    r'(?P<republic>Republic of Kenya|REPUBLIC OF KENYA)'
+    r'|(?P<programme>KJET)'
+    r'|(?P<section>Cluster / Enterprise|ORGANISATION DETAILS)'
+)
+
+
+def is_cohort2_text(text_content):
+    """Return True when the text contains the republic, programme and section markers of a Cohort 2 form."""
+    seen_groups = set()
+    for match in COHORT2_MARKER_PATTERN.finditer(text_content):
+        seen_groups.add(match.lastgroup)
+        if len(seen_groups) == 3:
+            return True
+    return False
+
+
+# Reference questions are parsed once per process and reused for every application
+@functools.lru_cache(maxsize=None)
+def get_reference_questions():
+    """
+    Return {question_num: (question, partial_question)}, loading questions.txt on first use.
+    partial_question is the first five words, used when the form text differs slightly from the reference.
+    """
+    return {
+        num: (question, ' '.join(question.split()[:5]))
+        for num, question in load_questions().items()
+    }
+
+
+@functools.lru_cache(maxsize=None)
+def compile_prompt_patterns(prompt, multi_line=False):
+    """
+    Compile the value pattern and the next-line fallback pattern for a Cohort 2 prompt.
+    Each prompt is compiled once per process and reused for every application.
+    """
+    # Use a pattern that doesn't cross newlines for the separator unless multi_line is True
+    separator = r"[: \t\?]*"
+    pattern = re.escape(prompt) + separator
+
+    if multi_line:
+        pattern += r"(.*?)"
+        flags = re.IGNORECASE | re.DOTALL
+    else:
+        # Allow matching the same line, or if the rest of the line is empty, the next line
+        pattern += r"([^\n\r]*)"
+        flags = re.IGNORECASE
+
+    next_line_pattern = re.escape(prompt) + separator + r"\n\s*([^\n\r]+)"
+    return re.compile(pattern, flags), re.compile(next_line_pattern, re.IGNORECASE)
+
+
+def get_prompt_value(prompt, text, text_lower, end_prompts=None, multi_line=False):
+    """
+    Extract the value that follows a Cohort 2 prompt.
+    text_lower must be text.lower(); end prompts are located in it so the document is lowercased only once.
+    """
+    pattern, next_line_pattern = compile_prompt_patterns(prompt, multi_line)
+
+    if end_prompts:
+        # Look for the nearest end prompt
+        start_pos = -1
+        match = pattern.search(text)
+        if match:
+            start_pos = match.start(1)
+            
+            end_pos = len(text)
+            for end_p in end_prompts:
+                p_pos = text_lower.find(end_p.lower(), start_pos)
+                if p_pos != -1 and p_pos < end_pos:
+                    end_pos = p_pos
+            
+            val = text[start_pos:end_pos].strip()
+            # Clean up multiple spaces and strip separators
+            val = WHITESPACE_PATTERN.sub(' ', val)
+            if ' | ' in val:
+                val = val.split(' | ')[0].strip()
+            return val
+    else:
+        match = pattern.search(text)
+        if match:
+            val = match.group(1).strip()
+            # If result is empty and not multi_line, try looking at the next line
+            if not val and not multi_line:
+                # Search again but allow one newline
+                next_match = next_line_pattern.search(text)
+                if next_match:
+                    val = next_match.group(1).strip()
+            
+            # Strip artifacts like | Constituency...
+            if ' | ' in val:
+                val = val.split(' | ')[0].strip()
+            return val
+    return ""
+
+
 def extract_application_data_c2(text_content):
     """
     Extract data from Cohort 2 application format.
     Uses keyword and pattern matching for the new PDF structure.
     """
-    data = {col: "" for col in COLUMN_ORDER}
+    data = dict.fromkeys(COLUMN_ORDER, "")
 
-    # Helper to extract value after a prompt
-    def get_value(prompt, text, end_prompts=None, multi_line=False):
-        # Use a pattern that doesn't cross newlines for the separator unless multi_line is True
-        separator = r"[: \t\?]*"
-        pattern = re.escape(prompt) + separator
-        
-        if multi_line:
-            pattern += r"(.*?)"
-        else:
-            # Allow matching the same line, or if the rest of the line is empty, the next line
-            pattern += r"([^\n\r]*)"
-        
-        if end_prompts:
-            # Look for the nearest end prompt
-            start_pos = -1
-            match = re.search(pattern, text, re.IGNORECASE | re.DOTALL if multi_line else re.IGNORECASE)
-            if match:
-                start_pos = match.start(1)
-                
-                end_pos = len(text)
-                for end_p in end_prompts:
-                    p_pos = text.lower().find(end_p.lower(), start_pos)
-                    if p_pos != -1 and p_pos < end_pos:
-                        end_pos = p_pos
-                
-                val = text[start_pos:end_pos].strip()
-                # Clean up multiple spaces and strip separators
-                val = re.sub(r'\s+', ' ', val)
-                if ' | ' in val:
-                    val = val.split(' | ')[0].strip()
-                return val
-        else:
-            match = re.search(pattern, text, re.IGNORECASE | re.DOTALL if multi_line else re.IGNORECASE)
-            if match:
-                val = match.group(1).strip()
-                # If result is empty and not multi_line, try looking at the next line
-                if not val and not multi_line:
-                    # Search again but allow one newline
-                    next_line_pattern = re.escape(prompt) + separator + r"\n\s*([^\n\r]+)"
-                    next_match = re.search(next_line_pattern, text, re.IGNORECASE)
-                    if next_match:
-                        val = next_match.group(1).strip()
-                
-                # Strip artifacts like | Constituency...
-                if ' | ' in val:
-                    val = val.split(' | ')[0].strip()
-                return val
-        return ""
+    # Lowercase the document once; end prompts are located in this copy
+    text_lower = text_content.lower()
 
     # Basic Info
-    data["app_number"] = get_value("Application No", text_content)
-    data["cluster_name"] = get_value("What is the name of your cluster?", text_content)
+    data["app_number"] = get_prompt_value("Application No", text_content, text_lower)
+    data["cluster_name"] = get_prompt_value("What is the name of your cluster?", text_content, text_lower)
     if not data["cluster_name"]:
-        data["cluster_name"] = get_value("Cluster / Enterprise", text_content)
+        data["cluster_name"] = get_prompt_value("Cluster / Enterprise", text_content, text_lower)
     
-    data["registration_status"] = get_value("What is your registration status?", text_content)
-    data["registration_number"] = get_value("What is your registration number?", text_content)
+    data["registration_status"] = get_prompt_value("What is your registration status?", text_content, text_lower)
+    data["registration_number"] = get_prompt_value("What is your registration number?", text_content, text_lower)
     
     # Location
-    data["county"] = get_value("Which county are you located in?", text_content)
+    data["county"] = get_prompt_value("Which county are you located in?", text_content, text_lower)
     if not data["county"]:
-        data["county"] = get_value("County", text_content)
+        data["county"] = get_prompt_value("County", text_content, text_lower)
     
-    data["constituency"] = get_value("What constituency are you in?", text_content)
+    data["constituency"] = get_prompt_value("What constituency are you in?", text_content, text_lower)
     if not data["constituency"]:
-        data["constituency"] = get_value("Constituency", text_content)
+        data["constituency"] = get_prompt_value("Constituency", text_content, text_lower)
         
-    data["ward"] = get_value("What ward are you in?", text_content)
+    data["ward"] = get_prompt_value("What ward are you in?", text_content, text_lower)
     if not data["ward"]:
-        data["ward"] = get_value("Ward", text_content)
+        data["ward"] = get_prompt_value("Ward", text_content, text_lower)
         
-    data["location"] = get_value("What is your location / nearest landmark or village?", text_content)
-    data["place_of_operation"] = get_value("Where is your place of operation?", text_content)
+    data["location"] = get_prompt_value("What is your location / nearest landmark or village?", text_content, text_lower)
+    data["place_of_operation"] = get_prompt_value("Where is your place of operation?", text_content, text_lower)
 
     # Business Information
-    data["value_chain"] = get_value("Which value chain do you operate in?", text_content)
-    data["economic_activities_description"] = get_value("Briefly describe your main economic activities", text_content, 
+    data["value_chain"] = get_prompt_value("Which value chain do you operate in?", text_content, text_lower)
+    data["economic_activities_description"] = get_prompt_value("Briefly describe your main economic activities", text_content, text_lower,
                                                        end_prompts=["4. CONTACT INFORMATION", "Primary phone number"])
 
     # Contact Info
-    data["phone_number"] = get_value("Primary phone number for the cluster", text_content)
-    data["alternate_phone"] = get_value("Alternate phone number", text_content)
-    data["email"] = get_value("Official email address for the cluster", text_content)
+    data["phone_number"] = get_prompt_value("Primary phone number for the cluster", text_content, text_lower)
+    data["alternate_phone"] = get_prompt_value("Alternate phone number", text_content, text_lower)
+    data["email"] = get_prompt_value("Official email address for the cluster", text_content, text_lower)
 
     # Leadership
-    data["chairperson"] = get_value("Name of the Chairperson", text_content)
-    data["secretary"] = get_value("Name of the Secretary", text_content)
-    data["ceo"] = get_value("Name of the CEO", text_content)
-    data["director"] = get_value("Name of the Director", text_content)
-    data["manager"] = get_value("Name of the Manager", text_content)
-    data["treasurer"] = get_value("Name of the Treasurer", text_content)
+    data["chairperson"] = get_prompt_value("Name of the Chairperson", text_content, text_lower)
+    data["secretary"] = get_prompt_value("Name of the Secretary", text_content, text_lower)
+    data["ceo"] = get_prompt_value("Name of the CEO", text_content, text_lower)
+    data["director"] = get_prompt_value("Name of the Director", text_content, text_lower)
+    data["manager"] = get_prompt_value("Name of the Manager", text_content, text_lower)
+    data["treasurer"] = get_prompt_value("Name of the Treasurer", text_content, text_lower)
 
     # Woman Owned
-    data["woman_owned_enterprise"] = get_value("Is this a women-owned enterprise?", text_content)
+    data["woman_owned_enterprise"] = get_prompt_value("Is this a women-owned enterprise?", text_content, text_lower)
 
     # Membership & Employment
     # These are in blocks like:
@@ -155,87 +331,72 @@ def extract_application_data_c2(text_content):
     # Total members in 2022: 2349
     # Total employees in 2022: 7
     for year in ["2022", "2023", "2024"]:
-        data[f"members_{year}"] = get_value(f"Total members in {year}", text_content)
-        data[f"employees_{year}"] = get_value(f"Total employees in {year}", text_content)
+        data[f"members_{year}"] = get_prompt_value(f"Total members in {year}", text_content, text_lower)
+        data[f"employees_{year}"] = get_prompt_value(f"Total employees in {year}", text_content, text_lower)
 
     # Demographics (taking latest year for parity)
     for year in ["2024", "2023", "2022"]:
         if not data["members_male"]:
-            data["members_male"] = get_value(f"Male members in {year}", text_content)
-            data["members_female"] = get_value(f"Female members in {year}", text_content)
-            data["members_age_18_35"] = get_value(f"Members aged 18 35 in {year}", text_content)
-            data["members_age_36_50"] = get_value(f"Members aged 36 50 in {year}", text_content)
-            data["members_age_above_50"] = get_value(f"Members aged over 50 in {year}", text_content)
+            data["members_male"] = get_prompt_value(f"Male members in {year}", text_content, text_lower)
+            data["members_female"] = get_prompt_value(f"Female members in {year}", text_content, text_lower)
+            data["members_age_18_35"] = get_prompt_value(f"Members aged 18 35 in {year}", text_content, text_lower)
+            data["members_age_36_50"] = get_prompt_value(f"Members aged 36 50 in {year}", text_content, text_lower)
+            data["members_age_above_50"] = get_prompt_value(f"Members aged over 50 in {year}", text_content, text_lower)
 
     # Financial Info
     for year in ["2022", "2023", "2024"]:
-        data[f"turnover_{year}"] = get_value(fr"Total revenue in {year} \(KES\)", text_content)
-        data[f"net_profit_{year}"] = get_value(fr"Total profits in {year} \(KES\)", text_content)
+        data[f"turnover_{year}"] = get_prompt_value(fr"Total revenue in {year} \(KES\)", text_content, text_lower)
+        data[f"net_profit_{year}"] = get_prompt_value(fr"Total profits in {year} \(KES\)", text_content, text_lower)
 
     # Operations
-    data["critical_equipment_investment_plans"] = get_value("List your most critical equipment for operations", text_content, 
+    data["critical_equipment_investment_plans"] = get_prompt_value("List your most critical equipment for operations", text_content, text_lower,
                                                            end_prompts=["Describe your price / cost margins"])
-    data["price_cost_margins"] = get_value("Describe your price / cost margins", text_content)
-    data["accounting_package"] = get_value("Which accounting package or system do you use?", text_content)
+    data["price_cost_margins"] = get_prompt_value("Describe your price / cost margins", text_content, text_lower)
+    data["accounting_package"] = get_prompt_value("Which accounting package or system do you use?", text_content, text_lower)
 
     # E-commerce
-    data["ecommerce_channels"] = get_value("Which e-commerce or digital channels do you use?", text_content)
-    data["sales_domestic_b2b_percent"] = get_value("Roughly what percentage of your sales are B2B?", text_content)
-    data["sales_domestic_b2c_percent"] = get_value("Roughly what percentage of your sales are B2C?", text_content)
-    data["exports_percent"] = get_value("Roughly what percentage of your sales are exports?", text_content)
+    data["ecommerce_channels"] = get_prompt_value("Which e-commerce or digital channels do you use?", text_content, text_lower)
+    data["sales_domestic_b2b_percent"] = get_prompt_value("Roughly what percentage of your sales are B2B?", text_content, text_lower)
+    data["sales_domestic_b2c_percent"] = get_prompt_value("Roughly what percentage of your sales are B2C?", text_content, text_lower)
+    data["exports_percent"] = get_prompt_value("Roughly what percentage of your sales are exports?", text_content, text_lower)
 
     # Strategy & Challenges
-    data["business_objectives"] = get_value("Does the organization have clear objectives and performance targets in place?", text_content, 
+    data["business_objectives"] = get_prompt_value("Does the organization have clear objectives and performance targets in place?", text_content, text_lower,
                                            end_prompts=["Who are your organization's main competitors?"])
-    data["main_competitors"] = get_value("Who are your organization's main competitors?", text_content, 
+    data["main_competitors"] = get_prompt_value("Who are your organization's main competitors?", text_content, text_lower,
                                         end_prompts=["What are critical success factors in your industry?"])
-    data["success_factors"] = get_value("What are critical success factors in your industry?", text_content, 
+    data["success_factors"] = get_prompt_value("What are critical success factors in your industry?", text_content, text_lower,
                                        end_prompts=["Please describe your backward linkages"])
-    data["backward_linkages"] = get_value("Please describe your backward linkages", text_content, 
+    data["backward_linkages"] = get_prompt_value("Please describe your backward linkages", text_content, text_lower,
                                          end_prompts=["What is your marketing plan for future market expansion?"])
-    data["marketing_expansion_plan"] = get_value("What is your marketing plan for future market expansion?", text_content, 
+    data["marketing_expansion_plan"] = get_prompt_value("What is your marketing plan for future market expansion?", text_content, text_lower,
                                                 end_prompts=["What is the problem statement", "15. "])
-    data["problem_statement"] = get_value("What is the problem statement(.*?)Additionally, specify specific areas where project Business Development Services support could be helpful", text_content, 
+    data["problem_statement"] = get_prompt_value("What is the problem statement(.*?)Additionally, specify specific areas where project Business Development Services support could be helpful", text_content, text_lower,
                                          end_prompts=["What sustainable practices have you adopted?", "Describe the challenges your cluster is currently facing"])
     if not data["problem_statement"]:
-        data["problem_statement"] = get_value("Describe the challenges your cluster is currently facing", text_content, 
+        data["problem_statement"] = get_prompt_value("Describe the challenges your cluster is currently facing", text_content, text_lower,
                                              end_prompts=["15. ", "What sustainable practices have you adopted?"])
     
-    data["sustainable_practices"] = get_value("What sustainable practices have you adopted?", text_content, 
+    data["sustainable_practices"] = get_prompt_value("What sustainable practices have you adopted?", text_content, text_lower,
                                              end_prompts=["Describe any green initiatives", "Generated on"])
     if not data["sustainable_practices"]:
-        data["sustainable_practices"] = get_value("Describe any green initiatives or sustainable practices your cluster has implemented", text_content, 
+        data["sustainable_practices"] = get_prompt_value("Describe any green initiatives or sustainable practices your cluster has implemented", text_content, text_lower,
                                                  end_prompts=["Generated on"])
 
     # Submitted At
-    data["submitted_at"] = get_value("Submitted", text_content)
+    data["submitted_at"] = get_prompt_value("Submitted", text_content, text_lower)
 
     # --- Cleanup captured prompts and status strings ---
     if data["app_number"]:
-        data["app_number"] = data["app_number"].split(" Status:")[0].split(" Status")[0].strip()
+        data["app_number"] = data["app_number"].partition(" Status")[0].strip()
     
-    prompts_to_remove = {
-        "business_objectives": "Please specify the targets and how they are reviewed: (200 words or less)",
-        "main_competitors": "(If this differs by product/sales channel, please specify): (200 words or less)",
-        "success_factors": "What makes your organization unique versus competitors?: (200 words or less)",
-        "backward_linkages": "current suppliers of raw materials. Specify the main items your organization procures. For each item, indicate: Whether it is locally sourced or imported, Whether it is procured from large firms, MSMEs, cooperatives, or other types of suppliers, Any notable challenges or dependencies in your supply chain: (200 words or less)",
-        "marketing_expansion_plan": "Please describe the markets you aim to grow in, the reasons for targeting them, and your strategies for achieving this growth. Include details such as: Customer outreach methods, Operational enhancements, Planned investments, Progress made so far (e.g., discussions or MOUs with potential customers): (200 words or less)",
-        "problem_statement": "and the specific needs to be addressed. Highlight areas where project Business Development Services support could be beneficial: (200 words or less)",
-        "sustainable_practices": "Sustainable practices refer to environmentally friendly initiatives or actions taken by your cluster to minimize negative impacts on the environment and impacts from the environment (e.g., resilience to drought). Please",
-    }
-    
-    for field, prompt in prompts_to_remove.items():
+    for field, pattern in PROMPT_CLEANUP_PATTERNS.items():
         if data.get(field):
-            # Remove the prompt if it exists at the start or within the text
-            # Handling potential slight variations in whitespace
-            val = data[field]
-            if prompt.lower() in val.lower():
-                # Use regex to replace case-insensitively and handle potential 'n' or whitespace after prompt
-                val = re.sub(re.escape(prompt) + r"[\s\n]*", "", val, flags=re.IGNORECASE).strip()
-            data[field] = val
+            # Remove the prompt if it exists at the start or within the text, along with any whitespace after it
+            data[field] = pattern.sub("", data[field]).strip()
 
     if data["submitted_at"]:
-        data["submitted_at"] = data["submitted_at"].replace("Cohort:", "").replace("Chort:", "").strip()
+        data["submitted_at"] = COHORT_LABEL_PATTERN.sub("", data["submitted_at"]).strip()
 
     return data
 def extract_application_data(text_content):
@@ -245,196 +406,196 @@ def extract_application_data(text_content):
     """
 
     # Detect cohort
-    is_c2 = (
-        ("Republic of Kenya" in text_content or "REPUBLIC OF KENYA" in text_content) and 
-        ("KJET" in text_content) and
-        ("Cluster / Enterprise" in text_content or "ORGANISATION DETAILS" in text_content)
-    )
-    if is_c2:
+    if is_cohort2_text(text_content):
         return extract_application_data_c2(text_content)
 
-    # Remove page headers and clean up text
-    text_content = text_content.replace("Application Details\n", "")
-    text_content = text_content.replace("Application Details", "")
+    # Remove page headers and fix special characters in one scan over the text
+    text_content = TEXT_CLEANUP_PATTERN.sub(lambda match: TEXT_CLEANUP_REPLACEMENTS[match.group(0)], text_content)
 
     # Load reference questions
-    reference_questions = load_questions()
-
-    # Define column mappings (question number -> snake_case name)
-    column_mapping = {
-        1: "app_id",
-        2: "app_number",
-        3: "cluster_name",
-        4: "registration_status",
-        5: "registration_status_other",
-        6: "registration_number",
-        7: "county",
-        8: "constituency",
-        9: "ward",
-        10: "location",
-        11: "phone_number",
-        12: "alternate_phone",
-        13: "email",
-        14: "chairperson",
-        15: "secretary",
-        16: "ceo",
-        17: "director",
-        18: "manager",
-        19: "treasurer",
-        20: "woman_owned_enterprise",
-        21: "woman_owned_explanation",
-        22: "place_of_operation",
-        23: "place_of_operation_other",
-        24: "place_of_operation_name",
-        25: "members_2022",
-        26: "members_2023",
-        27: "members_2024",
-        28: "employees_2022",
-        29: "employees_2023",
-        30: "employees_2024",
-        31: "members_male",
-        32: "members_female",
-        33: "members_age_18_35",
-        34: "members_age_36_50",
-        35: "members_age_above_50",
-        36: "value_chain",
-        37: "value_chain_other",
-        38: "economic_activities_description",
-        39: "turnover_2022",
-        40: "net_profit_2022",
-        41: "turnover_2023",
-        42: "net_profit_2023",
-        43: "turnover_2024",
-        44: "net_profit_2024",
-        45: "business_objectives",
-        46: "main_competitors",
-        47: "success_factors",
-        48: "critical_equipment_investment_plans",
-        49: "price_cost_margins",
-        50: "accounting_package",
-        51: "accounting_package_other",
-        52: "backward_linkages",
-        53: "ecommerce_channels",
-        54: "sales_domestic_b2b_percent",
-        55: "b2b_description",
-        56: "sales_domestic_b2c_percent",
-        57: "b2c_description",
-        58: "exports_percent",
-        59: "exports_description",
-        60: "marketing_expansion_plan",
-        61: "problem_statement",
-        62: "sustainable_practices",
-        63: "submitted_at"
-    }
+    reference_questions = get_reference_questions()
 
-    # Extract data using string algorithms
-    data = {}
+    # Extract data using string algorithms; every column starts out present so rows can be built with ROW_GETTER
+    data = dict.fromkeys(COLUMN_ORDER, "")
 
     # Clean and normalize text for better matching
-    normalized_text = re.sub(r'\s+', ' ', text_content)  # Replace multiple whitespace with single space
+    normalized_text = WHITESPACE_PATTERN.sub(' ', text_content)  # Replace multiple whitespace with single space
+
+    # Locate every "<n>. " question marker in a single pass, keeping only numbers that can
+    # start (1-63) or end (up to 64) a question block
+    markers = []
+    for match in QUESTION_MARKER_PATTERN.finditer(normalized_text):
+        num = int(match.group(1))
+        if 1 <= num <= 64:
+            markers.append((num, match.start(), match.end()))
+    first_marker = {}
+    for index, (num, _, _) in enumerate(markers):
+        first_marker.setdefault(num, index)
+
+    # A question's answer runs until the next marker with a higher number (lower numbers inside an
+    # answer are list items, not questions). Resolve that boundary for every marker in one pass
+    # with a stack of markers still waiting for a higher-numbered successor.
+    next_question_starts = [len(normalized_text)] * len(markers)
+    pending = []
+    for index, (num, start, _) in enumerate(markers):
+        while pending and markers[pending[-1]][0] < num:
+            next_question_starts[pending.pop()] = start
+        pending.append(index)
 
     # Find answers by looking for content between consecutive questions
     for question_num in range(1, 64):  # We have 63 questions
-        if question_num not in column_mapping:
+        if question_num not in QUESTION_COLUMN_MAPPING:
             continue
 
-        col_name = column_mapping[question_num]
-
-        # Build patterns to find this question and the next question
-        current_question_patterns = [
-            f"{question_num}. ",
-            f"\n{question_num}. ",
-            f" {question_num}. "
-        ]
+        col_name = QUESTION_COLUMN_MAPPING[question_num]
 
         # Find the start of current question
-        question_start = -1
-        for pattern in current_question_patterns:
-            pos = normalized_text.find(pattern)
-            if pos != -1:
-                question_start = pos + len(pattern)
-                break
-
-        if question_start == -1:
+        if question_num not in first_marker:
             # Question not found, set empty answer
             data[col_name] = ""
             continue
 
-        # Find the start of next question (or end of text)
-        next_question_start = len(normalized_text)  # Default to end of text
-
-        for next_num in range(question_num + 1, 65):  # Look for next questions
-            next_patterns = [
-                f"{next_num}. ",
-                f"\n{next_num}. ",
-                f" {next_num}. "
-            ]
+        index = first_marker[question_num]
+        question_start = markers[index][2]
 
-            for pattern in next_patterns:
-                pos = normalized_text.find(pattern, question_start)
-                if pos != -1 and pos < next_question_start:
-                    next_question_start = pos
-                    break
+        # Find the start of next question (or end of text)
+        next_question_start = next_question_starts[index]
 
         # Extract the content between current question and next question
         question_content = normalized_text[question_start:next_question_start].strip()
 
         # Remove the actual question text from the content if it's present
         if question_num in reference_questions:
-            ref_question = reference_questions[question_num]
+            ref_question, partial_question = reference_questions[question_num]
             # Try to remove question text from the beginning
             if question_content.startswith(ref_question):
                 question_content = question_content[len(ref_question):].strip()
             else:
-                # Try partial matching - sometimes questions might be slightly different
-                words = ref_question.split()[:5]  # First 5 words
-                partial_question = ' '.join(words)
+                # Try partial matching (first 5 words) - sometimes questions might be slightly different
                 if question_content.startswith(partial_question):
                     question_content = question_content[len(partial_question):].strip()
 
-        # Clean up the answer
+        # Clean up the answer; whitespace is already collapsed in normalized_text
         answer = question_content.strip()
 
-        # Remove newlines and normalize spaces
-        answer = re.sub(r'\s+', ' ', answer)
-
-        # Handle special characters
-        answer = answer.replace('â€¢', '•').replace('â€™', "'").replace('&amp;', '&')
-
         # Check if this is actually an answer or just question text
-        if (not answer or
-            answer.endswith('?') or
-            len(answer) < 2 or
-            answer in ['Business Objectives', 'Main Competitors', 'Success Factors', 'Other Value Chain', 'Other Accounting Package', 'Private_Premise']):
+        if is_placeholder_answer(answer):
             answer = ""
 
         data[col_name] = answer
 
     return data
 
-def process_application_info_pdf(pdf_path, output_dir, county_name, app_id):
+@functools.lru_cache(maxsize=None)
+def text_cache_version():
     """
-    Process a single application_info_*.pdf file and convert to CSV.
+    Short hash of the text extraction code (utils.py) and of the PDF backends this process can use,
+    so text cached by a different extract_pdf_text is not reused.
+    """
+    digest = hashlib.sha256(Path(utils.__file__).read_bytes())
+    available_backends = [name for name in utils.BACKEND_MODULES if getattr(utils, name) is not None]
+    digest.update(",".join(available_backends).encode('utf-8'))
+    return digest.hexdigest()[:12]
+
+
+def extract_pdf_text_cached(pdf_path, cache_dir=None):
+    """
+    Extract text from a PDF, reusing the text saved by an earlier run when the file is unchanged.
+    Cache entries are keyed by file name, size, modification time and text_cache_version();
+    pass cache_dir=None to bypass the cache.
+    """
+    if cache_dir is None:
+        return extract_pdf_text(pdf_path)
+
+    stat = pdf_path.stat()
+    cache_file = cache_dir / f"{pdf_path.stem}-{stat.st_size}-{stat.st_mtime_ns}-{text_cache_version()}.txt"
+    if cache_file.exists():
+        try:
+            with open(cache_file, 'r', newline='', encoding='utf-8') as f:
+                return f.read()
+        except (OSError, UnicodeDecodeError):
+            pass  # Unreadable entry: extract again and try to overwrite it
+
+    text_content = extract_pdf_text(pdf_path)
+
+    if not text_content.startswith("ERROR:"):
+        # Write to a temp file first so an interrupted run never leaves a truncated cache entry.
+        # A cache that cannot be written (full disk, read-only output) only costs the cache, not the row.
+        temp_file = cache_file.with_name(cache_file.name + f".{os.getpid()}.tmp")
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(temp_file, 'w', newline='', encoding='utf-8') as f:
+                f.write(text_content)
+            os.replace(temp_file, cache_file)
+        except OSError as e:
+            print(f"⚠️  Could not cache text for {pdf_path.name}: {e}")
+            try:
+                temp_file.unlink()
+            except OSError:
+                pass
+
+    return text_content
+
+
+# Answers that hold counts, amounts or percentages, normalized to plain numbers with --numeric-columns
+NUMERIC_COLUMNS = (
+    "members_2022", "members_2023", "members_2024", "employees_2022",
+    "employees_2023", "employees_2024", "members_male", "members_female",
+    "members_age_18_35", "members_age_36_50", "members_age_above_50",
+    "turnover_2022", "net_profit_2022", "turnover_2023", "net_profit_2023",
+    "turnover_2024", "net_profit_2024", "sales_domestic_b2b_percent",
+    "sales_domestic_b2c_percent", "exports_percent",
+)
+
+# Magnitude suffixes and words that scale the number they follow, e.g. "1.2M" or "1.5 million"
+NUMBER_MAGNITUDES = {
+    "k": 10**3, "thousand": 10**3,
+    "m": 10**6, "mn": 10**6, "million": 10**6,
+    "b": 10**9, "bn": 10**9, "billion": 10**9,
+}
+
+# A number with optional thousand separators and decimals, e.g. "1,250,000" or "-3.5",
+# plus an optional magnitude suffix that must end the word ("10 members" has none)
+NUMBER_PATTERN = re.compile(
+    r'(-?\d[\d,]*(?:\.\d+)?)(?:\s*(' + '|'.join(sorted(NUMBER_MAGNITUDES, key=len, reverse=True)) + r')\b)?',
+    re.IGNORECASE,
+)
+
+
+def normalize_numeric_value(value):
+    """
+    Reduce an answer such as "Ksh. 1,250,000", "KES 1.2M" or "40%" to "1250000", "1200000" or "40".
+    Answers that do not hold exactly one number (e.g. "10-20", "N/A") become "".
+    """
+    matches = NUMBER_PATTERN.findall(value)
+    if len(matches) != 1:
+        return ""
+    number, magnitude = matches[0]
+    number = number.replace(",", "")
+    if not magnitude:
+        return number
+    # Decimal keeps "1.2" * 10**6 exact; normalize() drops the trailing zeros again
+    scaled = (Decimal(number) * NUMBER_MAGNITUDES[magnitude.lower()]).normalize()
+    return format(scaled, "f")
+
+
+def extract_application_row(pdf_path, county_name, app_id, cache_dir=None, numeric_columns=False):
+    """
+    Extract a single application_info_*.pdf into a row ordered by COLUMN_ORDER.
+    With numeric_columns, the NUMERIC_COLUMNS answers are normalized to plain numbers.
+    Returns None when the PDF cannot be read or parsed.
     """
     try:
-        # Extract text from PDF
-        text_content = extract_pdf_text(pdf_path)
+        # Extract text from PDF (or reuse the text cached by a previous run)
+        text_content = extract_pdf_text_cached(pdf_path, cache_dir)
 
         if text_content.startswith("ERROR:"):
             print(f"❌ Failed to extract text from {pdf_path.name}: {text_content}")
-            return False
+            return None
 
         # Extract structured data
         app_data = extract_application_data(text_content)
 
-        # Ensure output directory exists
-        output_dir.mkdir(parents=True, exist_ok=True)
-
-        # Create output CSV file
-        output_file = output_dir / f"application_info_{app_id}.csv"
-
-        # Use global consistent column order
-
         # Ensure county and app_id are correctly set relative to structure
         if not app_data.get("county") or len(app_data["county"]) > 30:
             app_data["county"] = county_name
@@ -443,138 +604,250 @@ def process_application_info_pdf(pdf_path, output_dir, county_name, app_id):
         if not app_data.get("app_id") or len(str(app_data["app_id"])) > 20:
             app_data["app_id"] = app_id
         
-        # Ensure app_number is present
-        if not app_data.get("app_number"):
-            # If C2, the full folder name (without suffixes) might be the app number
-            if app_id and len(app_id) == 4 and "KJET" in str(pdf_path):
-                 # We can't easily reconstruct the full KJET number here without regex 
-                 # but we can at least try to use the app_id
-                 pass
-
-        # Write to CSV
-        with open(output_file, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=COLUMN_ORDER, quoting=csv.QUOTE_ALL)
-            writer.writeheader()
-            writer.writerow(app_data)
-
-        print(f"✅ {county_name}/{app_id}: {output_file.name} ({len(app_data)} fields)")
-        return True
+        if numeric_columns:
+            for col in NUMERIC_COLUMNS:
+                app_data[col] = normalize_numeric_value(app_data.get(col, ""))
+
+        # Use global consistent column order
+        return ROW_GETTER(app_data)
 
     except Exception as e:
         print(f"❌ Error processing {pdf_path.name}: {str(e)}")
-        return False
+        return None
+
 
+def format_csv_row(row):
+    """Serialize one row exactly as the county CSV writer would, including the line terminator."""
+    buffer = io.StringIO()
+    csv.writer(buffer, quoting=csv.QUOTE_ALL).writerow(row)
+    return buffer.getvalue()
 
-def merge_county_csvs(output_base_dir, counties_data):
+
+# Header line shared by every CSV this script writes
+CSV_HEADER_LINE = format_csv_row(COLUMN_ORDER)
+
+# Write buffer for the county CSVs, which stay open while many rows are appended
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Upper bound on counties merged concurrently; the merge is disk-bound, so more threads stop helping
+MAX_MERGE_THREADS = 16
+
+
+def write_individual_csv(output_dir, app_id, line):
     """
-    Memory-intensive approach to merge all individual CSV files per county into single county CSV files.
-    Reads each CSV into memory, ensures consistent headers, and properly combines all rows.
-    Places merged files in the root output/ folder as {county}_kjet_forms.csv
+    Write application_info_{app_id}.csv holding the header and one CSV-encoded row, and return its path.
+    The file is written under a temp name and moved into place, so workers handling the same
+    application ID never leave a torn file.
     """
-    print()
-    print("=" * 40)
-    print("MERGING COUNTY CSV FILES (Memory-intensive approach)")
-    print()
+    output_dir.mkdir(parents=True, exist_ok=True)
+    output_file = output_dir / f"application_info_{app_id}.csv"
+    temp_file = output_file.with_name(output_file.name + f".{os.getpid()}.tmp")
+    with open(temp_file, 'w', newline='', encoding='utf-8') as f:
+        f.write(CSV_HEADER_LINE)
+        f.write(line)
+    os.replace(temp_file, output_file)
+    return output_file
+
+
+def process_application_info_pdf(
+    pdf_path, output_dir, county_name, app_id, cache_dir=None, verbose=False, numeric_columns=False
+):
+    """
+    Process a single application_info_*.pdf file and convert to CSV.
+    Returns the CSV-encoded row on success and None on failure.
+    Per-file success lines are only printed when verbose is set; failures are always reported.
+    """
+    row = extract_application_row(pdf_path, county_name, app_id, cache_dir, numeric_columns)
+    if row is None:
+        return None
 
-    # Use global consistent column order
+    line = format_csv_row(row)
 
-    merged_files = []
-    total_merged = 0
+    try:
+        output_file = write_individual_csv(output_dir, app_id, line)
 
-    for county_name, _ in tqdm(counties_data.items(), desc="Merging counties"):
-        county_output_dir = output_base_dir / county_name
+        if verbose:
+            print(f"✅ {county_name}/{app_id}: {output_file.name} ({len(row)} fields)")
+        return line
 
-        if not county_output_dir.exists():
-            print(f"⚠️  {county_name}: County directory not found, skipping")
-            continue
+    except Exception as e:
+        print(f"❌ Error writing CSV for {pdf_path.name}: {str(e)}")
+        return None
 
-        # Find all individual CSV files for this county
-        csv_files = list(county_output_dir.glob("application_info_*.csv"))
 
-        if not csv_files:
-            print(f"⚠️  {county_name}: No CSV files found, skipping")
-            continue
+def process_application_task(task):
+    """
+    Worker entry point for the process pool.
+    Takes a (pdf_path, output_dir, county_name, app_id, keep_individual, cache_dir, verbose, numeric_columns)
+    tuple and returns (county_name, app_id, line), where line is the CSV-encoded row or None on failure.
+    Rows are serialized in the worker so the parent only appends ready-made lines to the county files.
+    """
+    pdf_path, output_dir, county_name, app_id, keep_individual, cache_dir, verbose, numeric_columns = task
+    if keep_individual:
+        line = process_application_info_pdf(
+            pdf_path, output_dir, county_name, app_id, cache_dir, verbose, numeric_columns
+        )
+        return county_name, app_id, line
 
-        # Create merged file path in root output directory
-        merged_file_path = output_base_dir / f"{county_name}_kjet_forms.csv"
+    row = extract_application_row(pdf_path, county_name, app_id, cache_dir, numeric_columns)
+    return county_name, app_id, format_csv_row(row) if row is not None else None
+
+
+def init_worker():
+    """
+    Warm a pool worker before its first task by parsing questions.txt, so that cost is not paid
+    inside the first application each worker processes. The PDF backends load with utils.
+    """
+    get_reference_questions()
+
+
+def run_application_tasks(tasks, jobs):
+    """Yield process_application_task results in task order, using a process pool unless jobs is 1."""
+    if jobs <= 1:
+        yield from map(process_application_task, tasks)
+        return
+
+    with ProcessPoolExecutor(max_workers=jobs, initializer=init_worker) as executor:
+        yield from executor.map(process_application_task, tasks, chunksize=8)
 
-        try:
-            print(f"🔄 Processing {county_name}: Loading {len(csv_files)} CSV files into memory...")
 
-            # Memory-intensive approach: Load all data into memory first
-            all_data_rows = []
+def open_county_csv(output_base_dir, county_name):
+    """
+    Open the merged {county}_kjet_forms.csv for direct writes, starting with the header row.
+    Rows go to a temp file that close_county_csv swaps into place.
+    """
+    merged_file_path = output_base_dir / f"{county_name}_kjet_forms.csv"
+    temp_file_path = merged_file_path.with_name(merged_file_path.name + ".tmp")
+    f = open(temp_file_path, 'w', newline='', encoding='utf-8', buffering=WRITE_BUFFER_SIZE)
+    f.write(CSV_HEADER_LINE)
+    return {
+        "county_name": county_name,
+        "file": f,
+        "path": merged_file_path,
+        "temp_path": temp_file_path,
+        "app_ids": set(),
+    }
+
+
+def close_county_csv(county_csv):
+    """Close a county CSV opened with open_county_csv and move it into place. Returns (path, rows, bytes)."""
+    county_csv["file"].close()
+    os.replace(county_csv["temp_path"], county_csv["path"])
+    return county_csv["path"], len(county_csv["app_ids"]), county_csv["path"].stat().st_size
 
-            for i, csv_file in enumerate(sorted(csv_files)):
+
+def merge_one_county_csv(output_base_dir, county_name, column_indexes, verbose=False):
+    """
+    Stream one county's individual CSV files into {county}_kjet_forms.csv.
+    Returns (path, rows, bytes), or None when the county has nothing to merge.
+    """
+    county_output_dir = output_base_dir / county_name
+
+    # Find all individual CSV files for this county (the listing doubles as the existence check)
+    try:
+        csv_files = list_files_by_name(county_output_dir, "application_info_", ".csv")
+    except FileNotFoundError:
+        print(f"⚠️  {county_name}: County directory not found, skipping")
+        return None
+
+    if not csv_files:
+        print(f"⚠️  {county_name}: No CSV files found, skipping")
+        return None
+
+    # Create merged file path in root output directory; write to a temp file and swap it in at the end
+    merged_file_path = output_base_dir / f"{county_name}_kjet_forms.csv"
+    temp_file_path = merged_file_path.with_name(merged_file_path.name + ".tmp")
+
+    try:
+        print(f"🔄 Processing {county_name}: Streaming {len(csv_files)} CSV files...")
+
+        rows_written = 0
+
+        with open(temp_file_path, 'w', newline='', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as out:
+            writer = csv.writer(out, quoting=csv.QUOTE_ALL)
+            writer.writerow(COLUMN_ORDER)
+
+            for csv_file in csv_files:
                 try:
-                    # Read the entire CSV file into memory
-                    with open(csv_file, 'r', encoding='utf-8') as f:
-                        # Read all lines into memory
-                        content = f.read().strip()
-
-                        if not content:
-                            print(f"    ⚠️  Empty file: {csv_file.name}")
-                            continue
-
-                        # Split into lines
-                        lines = content.split('\n')
-
-                        if len(lines) < 2:  # Need at least header + 1 data row
-                            print(f"    ⚠️  Insufficient data in file: {csv_file.name}")
-                            continue
-
-                        # Parse CSV manually to ensure consistency
-                        csv_reader = csv.reader(lines, quoting=csv.QUOTE_ALL)
-                        rows = list(csv_reader)
-
-                        if len(rows) < 2:
-                            print(f"    ⚠️  No data rows in file: {csv_file.name}")
-                            continue
-
-                        # Get header and data
-                        header = rows[0]
-                        data_row = rows[1]  # Should only be one data row per file
-
-                        # Create dictionary from header and data
-                        if len(header) == len(data_row):
-                            row_dict = dict(zip(header, data_row))
-                            all_data_rows.append(row_dict)
-                            print(f"    ✅ Loaded {csv_file.name}: {len(row_dict)} fields")
-                        else:
-                            print(f"    ❌ Header/data mismatch in {csv_file.name}: {len(header)} headers vs {len(data_row)} data fields")
+                    # Stream the header and the single data row straight through the CSV parser
+                    with open(csv_file, 'r', newline='', encoding='utf-8') as f:
+                        reader = csv.reader(f)
+                        header = next(reader, None)
+                        data_row = next(reader, None)
+
+                    if not header or not data_row:
+                        print(f"    ⚠️  No data rows in file: {csv_file.name}")
+                        continue
+
+                    if len(header) != len(data_row):
+                        print(f"    ❌ Header/data mismatch in {csv_file.name}: {len(header)} headers vs {len(data_row)} data fields")
+                        continue
+
+                    # Every per-application file normally shares one header, so its index map is built once
+                    indexes = column_indexes.get(tuple(header))
+                    if indexes is None:
+                        positions = {name: i for i, name in enumerate(header)}
+                        indexes = column_indexes[tuple(header)] = [positions.get(col, -1) for col in COLUMN_ORDER]
+
+                    # Reorder to COLUMN_ORDER; missing columns become empty strings and unknown ones are dropped
+                    writer.writerow([data_row[i] if i >= 0 else "" for i in indexes])
+                    rows_written += 1
+                    if verbose:
+                        print(f"    ✅ Merged {csv_file.name}: {len(header)} fields")
 
                 except Exception as e:
                     print(f"    ❌ Error reading {csv_file.name}: {str(e)}")
                     continue
 
-            if not all_data_rows:
-                print(f"❌ {county_name}: No valid data found, skipping")
-                continue
+        if not rows_written:
+            temp_file_path.unlink()
+            print(f"❌ {county_name}: No valid data found, skipping")
+            return None
 
-            print(f"    📊 Loaded {len(all_data_rows)} applications into memory")
+        os.replace(temp_file_path, merged_file_path)
 
-            # Write the merged file with consistent column order
-            print(f"    💾 Writing merged file...")
-            with open(merged_file_path, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=COLUMN_ORDER, quoting=csv.QUOTE_ALL)
-                writer.writeheader()
+        file_size = merged_file_path.stat().st_size
+        print(f"✅ {county_name}: {rows_written} applications merged → {merged_file_path.name} ({file_size:,} bytes)")
+        return merged_file_path, rows_written, file_size
 
-                for row_dict in all_data_rows:
-                    # Ensure all columns exist with proper defaults
-                    complete_row = {}
-                    for col in COLUMN_ORDER:
-                        complete_row[col] = row_dict.get(col, "")  # Use empty string for missing columns
+    except Exception as e:
+        print(f"❌ Error merging {county_name}: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return None
 
-                    writer.writerow(complete_row)
 
-            file_size = merged_file_path.stat().st_size
-            print(f"✅ {county_name}: {len(all_data_rows)} applications merged → {merged_file_path.name} ({file_size:,} bytes)")
-            merged_files.append(merged_file_path)
-            total_merged += len(all_data_rows)
+def merge_county_csvs(output_base_dir, counties_data, verbose=False):
+    """
+    Stream all individual CSV files per county into single county CSV files.
+    Each application row is read and written straight through with a consistent column order,
+    so memory use stays constant regardless of how many applications a county has.
+    Counties are independent file I/O, so several are merged at once on a thread pool.
+    Places merged files in the root output/ folder as {county}_kjet_forms.csv
+    """
+    print()
+    print("=" * 40)
+    print("MERGING COUNTY CSV FILES (Streaming approach)")
+    print()
+
+    # Use global consistent column order; maps a header tuple to the COLUMN_ORDER source indexes.
+    # Shared by the merge threads: a lost race only rebuilds the same index list.
+    column_indexes = {}
+
+    def merge_county(county_name):
+        return merge_one_county_csv(output_base_dir, county_name, column_indexes, verbose)
 
-        except Exception as e:
-            print(f"❌ Error merging {county_name}: {str(e)}")
-            import traceback
-            traceback.print_exc()
+    max_workers = min(MAX_MERGE_THREADS, len(counties_data))
+    if max_workers > 1:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(tqdm(
+                executor.map(merge_county, counties_data), total=len(counties_data), desc="Merging counties"
+            ))
+    else:
+        results = [merge_county(county_name) for county_name in tqdm(counties_data, desc="Merging counties")]
+
+    merged_files = [result for result in results if result is not None]
+    total_merged = sum(row_count for _, row_count, _ in merged_files)
 
     print()
     print("=" * 40)
@@ -583,26 +856,30 @@ def merge_county_csvs(output_base_dir, counties_data):
     print(f"📁 Merged files location: {output_base_dir}")
     print()
     print("Merged county files:")
-    for merged_file in sorted(merged_files):
-        file_size = merged_file.stat().st_size
-        county_name = merged_file.stem.replace("_kjet_forms", "")
+    for merged_file, row_count, file_size in sorted(merged_files):
+        print(f"  📄 {merged_file.name}: {row_count} applications ({file_size:,} bytes)")
 
-        # Count rows in the merged file
-        with open(merged_file, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            row_count = sum(1 for _ in reader)
 
-        print(f"  📄 {merged_file.name}: {row_count} applications ({file_size:,} bytes)")
+def list_files_by_name(folder, prefix, suffix):
+    """
+    Return the files in folder whose names start with prefix and end with suffix, sorted by name.
+    A single os.scandir pass with plain string checks, instead of glob's per-entry pattern matching.
+    """
+    with os.scandir(folder) as entries:
+        names = [
+            entry.name for entry in entries
+            if entry.name.startswith(prefix) and entry.name.endswith(suffix) and entry.is_file()
+        ]
+    folder = Path(folder)
+    return [folder / name for name in sorted(names)]
 
 
 def find_application_form_pdfs(app_folder: Path):
     """Return PDFs that look like the main application form, preferring legacy names."""
-    search_patterns = ["application_info_*.pdf", "application_*.pdf"]
-    for pattern in search_patterns:
-        matches = sorted(app_folder.glob(pattern))
-        if matches:
-            return matches
-    return []
+    # application_*.pdf also covers the legacy application_info_*.pdf names, so the folder is listed once
+    matches = list_files_by_name(app_folder, "application_", ".pdf")
+    legacy_matches = [path for path in matches if path.name.startswith("application_info_")]
+    return legacy_matches or matches
 
 
 def parse_args():
@@ -617,6 +894,32 @@ def parse_args():
         default="latest",
         help="Optional cohort folder under data/ when --data-dir is not provided",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of worker processes for PDF extraction (1 runs serially in this process)",
+    )
+    parser.add_argument(
+        "--no-text-cache",
+        action="store_true",
+        help="Re-extract every PDF instead of reusing text cached under output/<cohort>/.text_cache",
+    )
+    parser.add_argument(
+        "--numeric-columns",
+        action="store_true",
+        help="Write member counts, turnover/profit and sales percentages as plain numbers (blank if unparseable)",
+    )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Print a line for every CSV written and merged, not just warnings, errors and summaries",
+    )
+    parser.add_argument(
+        "--keep-individual",
+        action="store_true",
+        help="Also write one application_info_<id>.csv per application and merge them afterwards",
+    )
     return parser.parse_args()
 
 
@@ -656,28 +959,30 @@ def process_all_counties(args):
     print(f"Found {len(counties_data)} counties with {total_applications} total applications")
     print()
 
-    # Process each county
-    for county_name, application_folders in tqdm(counties_data.items(), desc="Processing counties"):
+    # Collect one task per application; PDF extraction itself runs in worker processes
+    tasks = []
+    county_stats = {}
+    for county_name, application_folders in counties_data.items():
         county_output_dir = output_base_dir / county_name
-        county_processed = 0
-        county_success = 0
-        county_failed = 0
+        county_cache_dir = None if args.no_text_cache else output_base_dir / ".text_cache" / county_name
 
         if not application_folders:
             print(f"⚪ {county_name}: No applications found")
             continue
 
-        # Process each application folder in the county
-        for app_folder in tqdm(application_folders, desc=f"  {county_name}", leave=False):
+        stats = county_stats.setdefault(county_name, {"processed": 0, "success": 0, "failed": 0})
+        county_tasks = []
+
+        for app_folder in application_folders:
             total_processed += 1
-            county_processed += 1
+            stats["processed"] += 1
 
             # Extract application ID from folder name
             app_id = extract_application_id_from_folder_name(app_folder.name)
             if not app_id:
                 print(f"❌ Could not extract app ID from folder: {app_folder.name}")
                 total_failed += 1
-                county_failed += 1
+                stats["failed"] += 1
                 continue
 
             # Look for application_info_*.pdf file (fall back to application_*.pdf for new data)
@@ -686,27 +991,74 @@ def process_all_counties(args):
             if not app_info_files:
                 print(f"⚠️  {county_name}/{app_id}: No application_info_*.pdf found")
                 total_failed += 1
-                county_failed += 1
+                stats["failed"] += 1
                 continue
 
             if len(app_info_files) > 1:
                 print(f"⚠️  {county_name}/{app_id}: Multiple application_info files found, using first one")
 
-            # Process the application_info PDF
-            app_info_pdf = app_info_files[0]
-            success = process_application_info_pdf(app_info_pdf, county_output_dir, county_name, app_id)
+            county_tasks.append((
+                app_info_files[0], county_output_dir, county_name, app_id,
+                args.keep_individual, county_cache_dir, args.verbose, args.numeric_columns,
+            ))
 
-            if success:
-                total_success += 1
-                county_success += 1
-            else:
+        # Keep the same per-county row order as merging the sorted per-application CSVs
+        # (the sort is stable, so repeated IDs stay in the order the old serial run processed them)
+        county_tasks.sort(key=lambda task: f"application_info_{task[3]}.csv")
+        tasks.extend(county_tasks)
+
+    # Process the application_info PDFs in parallel (one process per job).
+    # Unless individual CSVs are kept, rows are written straight into the merged county CSVs.
+    # Tasks are grouped by county and results come back in task order, so each county file is
+    # written in one batch and finished as soon as the next county's rows start arriving.
+    merged_files = []
+    county_csv = None
+    results = tqdm(run_application_tasks(tasks, args.jobs), total=len(tasks), desc="Processing applications")
+    # Tasks are sorted by application ID within each county, so repeated IDs arrive back to back.
+    # As when every run overwrote application_info_{id}.csv, the last successful row wins.
+    for (county_name, app_id), group in itertools.groupby(results, key=operator.itemgetter(0, 1)):
+        stats = county_stats[county_name]
+        lines = []
+        for _, _, line in group:
+            if line is None:
                 total_failed += 1
-                county_failed += 1
+                stats["failed"] += 1
+            else:
+                total_success += 1
+                stats["success"] += 1
+                lines.append(line)
 
-        # Print county summary
-        if county_processed > 0:
-            success_rate = (county_success / county_processed) * 100
-            print(f"📊 {county_name}: {county_success}/{county_processed} successful ({success_rate:.1f}%)")
+        if not lines:
+            continue
+        line = lines[-1]
+        if len(lines) > 1:
+            tqdm.write(f"⚠️  {county_name}/{app_id}: Duplicate application ID, keeping the last row")
+
+        if args.keep_individual:
+            if len(lines) > 1:
+                # The duplicates' workers may have finished in any order; settle the file on the last row
+                try:
+                    write_individual_csv(output_base_dir / county_name, app_id, line)
+                except OSError as e:
+                    print(f"❌ Error writing CSV for {county_name}/{app_id}: {str(e)}")
+            continue
+
+        if county_csv is None or county_csv["county_name"] != county_name:
+            if county_csv is not None:
+                merged_files.append(close_county_csv(county_csv))
+            county_csv = open_county_csv(output_base_dir, county_name)
+
+        county_csv["file"].write(line)
+        county_csv["app_ids"].add(app_id)
+
+    if county_csv is not None:
+        merged_files.append(close_county_csv(county_csv))
+
+    # Print county summaries
+    for county_name, stats in county_stats.items():
+        if stats["processed"] > 0:
+            success_rate = (stats["success"] / stats["processed"]) * 100
+            print(f"📊 {county_name}: {stats['success']}/{stats['processed']} successful ({success_rate:.1f}%)")
 
     # Print final summary
     print()
@@ -719,19 +1071,27 @@ def process_all_counties(args):
     print(f"❌ Failed: {total_failed}")
     print(f"📁 Output directory: {output_base_dir}")
     print()
+
+    if not args.keep_individual:
+        print("Merged county files:")
+        for merged_file, row_count, file_size in sorted(merged_files):
+            print(f"  📄 {merged_file.name}: {row_count} applications ({file_size:,} bytes)")
+        return
+
     print("CSV files organized by county:")
 
-    # Show output structure
+    # Show output structure; one listing of the output folder replaces a per-county exists() check
+    with os.scandir(output_base_dir) as entries:
+        county_dirs = {entry.name for entry in entries if entry.is_dir()}
     for county_name in sorted(counties_data.keys()):
-        county_output_dir = output_base_dir / county_name
-        if county_output_dir.exists():
-            csv_files = list(county_output_dir.glob("application_info_*.csv"))
+        if county_name in county_dirs:
+            csv_files = list_files_by_name(output_base_dir / county_name, "application_info_", ".csv")
             if csv_files:
                 print(f"  📁 {county_name}/: {len(csv_files)} CSV files")
 
     # Merge individual CSV files into county-wide files
     if total_success > 0:
-        merge_county_csvs(output_base_dir, counties_data)
+        merge_county_csvs(output_base_dir, counties_data, args.verbose)
 
 
 # Example usage
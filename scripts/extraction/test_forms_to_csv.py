@@ -0,0 +1,36 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from forms_to_csv import normalize_numeric_value
+
+
+class NormalizeNumericValueTests(unittest.TestCase):
+    def test_plain_numbers(self):
+        self.assertEqual(normalize_numeric_value("Ksh. 1,250,000"), "1250000")
+        self.assertEqual(normalize_numeric_value("40%"), "40")
+        self.assertEqual(normalize_numeric_value("-3.5"), "-3.5")
+        self.assertEqual(normalize_numeric_value("120 members"), "120")
+
+    def test_magnitude_suffixes_are_expanded(self):
+        self.assertEqual(normalize_numeric_value("KES 1.2M"), "1200000")
+        self.assertEqual(normalize_numeric_value("1.5 million"), "1500000")
+        self.assertEqual(normalize_numeric_value("1,200K"), "1200000")
+        self.assertEqual(normalize_numeric_value("250 thousand"), "250000")
+        self.assertEqual(normalize_numeric_value("2.5 Bn"), "2500000000")
+
+    def test_suffix_must_end_the_word(self):
+        self.assertEqual(normalize_numeric_value("10 months"), "10")
+        self.assertEqual(normalize_numeric_value("5 kg"), "5")
+
+    def test_ambiguous_answers_are_blank(self):
+        self.assertEqual(normalize_numeric_value("10-20"), "")
+        self.assertEqual(normalize_numeric_value("N/A"), "")
+        self.assertEqual(normalize_numeric_value(""), "")
+        self.assertEqual(normalize_numeric_value("Ksh 2M in 2023"), "")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,22 +4,93 @@ Utility functions for KJET document extraction.
 Contains reusable functions for text processing, PDF extraction, and data parsing.
 """
 
+import atexit
+import functools
+import importlib.util
+import itertools
+import os
 import re
+import shutil
 import subprocess
+import tempfile
+import threading
 import warnings
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 
+# Optional backends are imported once here; functions check for None instead of importing per call
+try:
+    import fitz  # PyMuPDF
+except ImportError:
+    fitz = None
+
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
+
+try:
+    import PyPDF2
+except ImportError:
+    PyPDF2 = None
+
+try:
+    from PIL import Image, ImageChops, ImageFilter
+except ImportError:
+    Image = ImageChops = ImageFilter = None
+
+try:
+    import pytesseract
+except ImportError:
+    pytesseract = None
+
+# Module globals bound by the optional imports above, with the module each one comes from
+BACKEND_MODULES = {
+    'fitz': 'fitz',
+    'pdfium': 'pypdfium2',
+    'PyPDF2': 'PyPDF2',
+    'Image': 'PIL.Image',
+    'ImageChops': 'PIL.ImageChops',
+    'ImageFilter': 'PIL.ImageFilter',
+    'pytesseract': 'pytesseract',
+}
+
+
+def rebind_missing_backends():
+    """Import the backends that were missing when this module loaded, e.g. after check_dependencies installed them."""
+    importlib.invalidate_caches()
+    for global_name, module_name in BACKEND_MODULES.items():
+        if globals()[global_name] is None:
+            try:
+                globals()[global_name] = importlib.import_module(module_name)
+            except ImportError:
+                pass
+
 APPLICATION_FOLDER_PATTERNS = [
     re.compile(r'^application_\d+_bundle(?: \(\d+\))?$'),
     re.compile(r'^application_KJET-[A-Z0-9-]+(?:_with_attachments(?:_\d{4}-\d{2}-\d{2}_\d{2}-\d{2}-\d{2})?)?$', re.IGNORECASE)
 ]
 
+# Numeric ID in legacy bundle folder names such as application_387_bundle (1)
+BUNDLE_ID_PATTERN = re.compile(r'application_(\d+)_bundle')
+DIGITS_PATTERN = re.compile(r'\d+')
+
+# clean_extracted_text: characters outside this set become spaces (punctuation useful for LLMs is kept)
+DISALLOWED_CHARS_PATTERN = re.compile(r'[^\w\s\-\.\,\;\:\?\!\@\#\$\%\^\&\*\(\)\[\]\{\}\_\+\=\/\\|\'"<>]')
+# The same filter for pure-ASCII text as a str.translate table (derived from the pattern so they cannot drift)
+DISALLOWED_ASCII_TABLE = str.maketrans({
+    code: ' ' for code in range(128) if DISALLOWED_CHARS_PATTERN.match(chr(code))
+})
+HORIZONTAL_WHITESPACE_PATTERN = re.compile(r'[ \t]+')
+EXCESS_NEWLINES_PATTERN = re.compile(r'\n{3,}')
+
 
 def is_application_folder_name(name: str) -> bool:
     """Determine whether a folder name matches any of the known application bundle patterns."""
     return any(pattern.match(name) for pattern in APPLICATION_FOLDER_PATTERNS)
 
 
+@functools.lru_cache(maxsize=4096)
 def extract_application_id_from_folder_name(folder_name):
     """
     Extract application ID from folder name, handling edge cases like:
@@ -29,8 +100,7 @@ def extract_application_id_from_folder_name(folder_name):
     - application_KJET-20251231112405-OPXW_with_attachments_2026-01-13_17-18-22 (use full folder name)
     """
     # Use regex to extract the numeric ID from folder names like application_XXX_bundle or application_XXX_bundle (N)
-    pattern = r'application_(\d+)_bundle'
-    match = re.search(pattern, folder_name)
+    match = BUNDLE_ID_PATTERN.search(folder_name)
     if match:
         return match.group(1)
 
@@ -48,9 +118,9 @@ def extract_application_id_from_folder_name(folder_name):
         return base
 
     # Fallback: try to extract any numbers from the folder name
-    numbers = re.findall(r'\d+', folder_name)
-    if numbers:
-        return numbers[0]  # Take the first number found
+    match = DIGITS_PATTERN.search(folder_name)
+    if match:
+        return match.group(0)  # Take the first number found
 
     return None
 
@@ -66,33 +136,71 @@ def clean_extracted_text(text):
     text = text.replace('\r', '\n')        # Handle old Mac line endings
 
     # Remove common OCR artifacts and noise (keep punctuation useful for LLMs)
-    text = re.sub(r'[^\w\s\-\.\,\;\:\?\!\@\#\$\%\^\&\*\(\)\[\]\{\}\_\+\=\/\\|\'"<>]', ' ', text)
+    # Most extracted text is ASCII, where a translate table is far cheaper than the regex
+    if text.isascii():
+        text = text.translate(DISALLOWED_ASCII_TABLE)
+    else:
+        text = DISALLOWED_CHARS_PATTERN.sub(' ', text)
 
     # Clean up excessive whitespace but preserve paragraph structure
-    text = re.sub(r'[ \t]+', ' ', text)    # Multiple spaces/tabs to single space
-    text = re.sub(r'\n{3,}', '\n\n', text) # Max 2 consecutive newlines
+    text = HORIZONTAL_WHITESPACE_PATTERN.sub(' ', text)  # Multiple spaces/tabs to single space
+    text = EXCESS_NEWLINES_PATTERN.sub('\n\n', text)      # Max 2 consecutive newlines
 
     return text.strip()
 
 
+def extract_with_pymupdf(pdf_path):
+    """Extract text using PyMuPDF, which is much faster than PyPDF2 on large batches."""
+    if fitz is None:
+        raise ImportError("PyMuPDF is not installed")
+    with fitz.open(str(pdf_path)) as doc:
+        parts = []
+        for page in doc:
+            page_text = page.get_text("text")
+            if page_text:
+                parts.append(page_text + "\n")
+        return "".join(parts)
+
+
+def extract_with_pypdfium2(pdf_path):
+    """Extract text using pypdfium2 (Google's PDFium), a fast native fallback when PyMuPDF is unavailable."""
+    if pdfium is None:
+        raise ImportError("pypdfium2 is not installed")
+    pdf = pdfium.PdfDocument(str(pdf_path))
+    try:
+        parts = []
+        for page in pdf:
+            textpage = page.get_textpage()
+            page_text = textpage.get_text_range()
+            textpage.close()
+            page.close()
+            if page_text:
+                parts.append(page_text + "\n")
+        return "".join(parts)
+    finally:
+        pdf.close()
+
+
 def extract_with_pypdf2_lenient(pdf_path):
     """Extract text using PyPDF2 with lenient error handling."""
-    import PyPDF2
+    if PyPDF2 is None:
+        raise ImportError("PyPDF2 is not installed")
     try:
         with open(pdf_path, 'rb') as file:
             with warnings.catch_warnings():
                 warnings.filterwarnings("ignore", category=UserWarning, message=r".*Advanced encoding /90ms-RKSJ-[HV].*")
                 reader = PyPDF2.PdfReader(file, strict=False)
-            text = ""
+            # Collect pages and join once; repeated += copies the growing text on every page
+            parts = []
             for page in reader.pages:
                 try:
                     page_text = page.extract_text()
                     if page_text:
-                        text += page_text + "\n"
+                        parts.append(page_text + "\n")
                 except Exception as e:
                     # Skip problematic pages but continue
                     continue
-            return text
+            return "".join(parts)
     except Exception as e:
         # Handle cases where file is corrupted or not a valid PDF
         if "Multiple definitions" in str(e) or "startxref" in str(e):
@@ -103,31 +211,44 @@ def extract_with_pypdf2_lenient(pdf_path):
 
 def extract_with_pypdf2_strict(pdf_path):
     """Extract text using PyPDF2 with strict error handling."""
-    import PyPDF2
+    if PyPDF2 is None:
+        raise ImportError("PyPDF2 is not installed")
     try:
         with open(pdf_path, 'rb') as file:
             with warnings.catch_warnings():
                 warnings.filterwarnings("ignore", category=UserWarning, message=r".*Advanced encoding /90ms-RKSJ-[HV].*")
                 reader = PyPDF2.PdfReader(file)
-            text = ""
+            parts = []
             for page in reader.pages:
                 page_text = page.extract_text()
                 if page_text:
-                    text += page_text + "\n"
-            return text
+                    parts.append(page_text + "\n")
+            return "".join(parts)
     except Exception as e:
         raise e
 
 
+def single_threaded_env():
+    """
+    Environment for native helper subprocesses (pdftotext, tesseract) that limits OpenMP to one
+    thread, so parallel workers do not oversubscribe the cores. Limits already set by the caller win.
+    """
+    env = dict(os.environ)
+    env.setdefault('OMP_THREAD_LIMIT', '1')
+    env.setdefault('OMP_NUM_THREADS', '1')
+    return env
+
+
 def extract_with_pdftotext(pdf_path):
     """Extract text using pdftotext command line tool as fallback."""
     try:
+        # Read raw bytes and decode once; pdftotext writes UTF-8 regardless of the locale
         result = subprocess.run(['pdftotext', str(pdf_path), '-'],
-                              capture_output=True, text=True, timeout=30)
+                              capture_output=True, env=single_threaded_env(), timeout=30)
         if result.returncode == 0:
-            return result.stdout
+            return result.stdout.decode('utf-8', 'replace')
 
-        stderr = (result.stderr or "").strip()
+        stderr = result.stderr.decode('utf-8', 'replace').strip()
         if stderr:
             print(f"pdftotext warning for {pdf_path}: {stderr[:300]}")
         return None
@@ -139,7 +260,6 @@ def repair_pdf(pdf_path):
     """Try to repair a corrupted PDF using mutool."""
     try:
         # Check if mutool is available
-        import shutil
         if not shutil.which('mutool'):
             return None
             
@@ -155,7 +275,23 @@ def repair_pdf(pdf_path):
 
 def extract_pdf_text(pdf_path):
     """Extract text from PDF using multiple methods with fallbacks."""
-    # Try PyPDF2 lenient first (handles most PDFs gracefully)
+    # Try PyMuPDF first (fastest); skipped when it is not installed or finds no text
+    try:
+        text = extract_with_pymupdf(pdf_path)
+        if text and text.strip():
+            return clean_extracted_text(text)
+    except Exception as e:
+        pass
+
+    # Try pypdfium2 next; like PyMuPDF it is native code and much faster than PyPDF2
+    try:
+        text = extract_with_pypdfium2(pdf_path)
+        if text and text.strip():
+            return clean_extracted_text(text)
+    except Exception as e:
+        pass
+
+    # Try PyPDF2 lenient (handles most PDFs gracefully)
     try:
         text = extract_with_pypdf2_lenient(pdf_path)
         if text and text.strip():
@@ -182,21 +318,86 @@ def extract_pdf_text(pdf_path):
     return "PDF appears to be image-based or corrupted - no extractable text found"
 
 
+def init_extraction_worker():
+    """Keep OCR/OpenMP from starting a thread per core inside every worker process."""
+    os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+
+
+def extract_pdf_text_batch(pdf_paths, workers=None):
+    """
+    Yield extract_pdf_text() for each path, in order, spreading the PDFs over worker processes.
+    workers defaults to the CPU count; workers=1 extracts serially in this process.
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1:
+        yield from map(extract_pdf_text, pdf_paths)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_extraction_worker) as executor:
+        yield from executor.map(extract_pdf_text, pdf_paths, chunksize=8)
+
+
+# tesserocr's API object is not thread-safe; calls are serialized within a process
+TESSEROCR_LOCK = threading.Lock()
+
+
+@functools.lru_cache(maxsize=None)
+def get_tesserocr_api():
+    """
+    Return a tesserocr.PyTessBaseAPI kept for the life of the process, so tesseract and its
+    language model are loaded once rather than per image. Returns None when tesserocr is not
+    installed or cannot initialize; extract_image_text then falls back to pytesseract.
+    """
+    try:
+        import tesserocr
+        api = tesserocr.PyTessBaseAPI()
+    except (ImportError, RuntimeError):
+        return None
+
+    atexit.register(api.End)
+    return api
+
+
+# Adaptive thresholding for OCR input: pixels darker than their neighbourhood mean by more than
+# the offset become black text, everything else white. Small crops are only converted to grayscale.
+OCR_BINARIZE_MIN_PIXELS = 1_000_000
+OCR_THRESHOLD_RADIUS = 15
+OCR_THRESHOLD_OFFSET = 10
+
+
+def prepare_image_for_ocr(image):
+    """
+    Convert an image to single-channel grayscale and, for page-sized images, binarize it against
+    the local mean so tesseract gets clean black-on-white input and can skip its own thresholding.
+    """
+    gray = image.convert('L')
+    if gray.width * gray.height < OCR_BINARIZE_MIN_PIXELS:
+        return gray
+
+    local_mean = gray.filter(ImageFilter.BoxBlur(OCR_THRESHOLD_RADIUS))
+    darkness = ImageChops.subtract(local_mean, gray)  # how much darker than its surroundings, clipped at 0
+    return darkness.point(lambda value: 0 if value > OCR_THRESHOLD_OFFSET else 255)
+
+
 def extract_image_text(image_path):
     """Extract text from image using OCR."""
     try:
-        import pytesseract
-        from PIL import Image
+        if Image is None:
+            raise ImportError("Pillow is not installed")
 
         # Open and process image
-        image = Image.open(image_path)
-
-        # Convert to RGB if necessary
-        if image.mode != 'RGB':
-            image = image.convert('RGB')
-
-        # Extract text using OCR
-        text = pytesseract.image_to_string(image)
+        image = prepare_image_for_ocr(Image.open(image_path))
+
+        # Extract text using OCR (in-process tesserocr when available, else a pytesseract subprocess)
+        api = get_tesserocr_api()
+        if api is not None:
+            with TESSEROCR_LOCK:
+                api.SetImage(image)
+                text = api.GetUTF8Text()
+        else:
+            if pytesseract is None:
+                raise ImportError("pytesseract is not installed")
+            text = pytesseract.image_to_string(image)
 
         return clean_extracted_text(text) if text else "No text extracted from image"
 
@@ -206,25 +407,117 @@ def extract_image_text(image_path):
         return f"OCR extraction failed: {str(e)}"
 
 
+# Patterns used by the guess_* helpers, compiled once at import.
+# Each tuple is tried in order and the first usable match wins.
+BUSINESS_NAME_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r"name of your cluster[?:]?\s*([^\n\r?]+)",
+    r"cluster name[?:]?\s*([^\n\r?]+)",
+    r"business name[?:]?\s*([^\n\r?]+)",
+    r"enterprise name[?:]?\s*([^\n\r?]+)",
+))
+APPLICATION_NUMBER_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r"application number[?:]?\s*([A-Z0-9\-]+)",
+    r"KJET[-\s]*([A-Z0-9\-]+)",
+    r"application id[?:]?\s*([A-Z0-9\-]+)",
+))
+EMAIL_PATTERN = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+# Kenyan formats: 07xxxxxxxx / 01xxxxxxxx, +2547xxxxxxxx, 2547xxxxxxxx
+PHONE_NUMBER_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r'\b0[17][0-9]{8}\b',
+    r'\b\+254[17][0-9]{8}\b',
+    r'\b254[17][0-9]{8}\b',
+))
+BUSINESS_TYPE_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r"registration status[?:]?\s*([^\n\r?]+)",
+    r"business type[?:]?\s*([^\n\r?]+)",
+    r"entity type[?:]?\s*([^\n\r?]+)",
+))
+def _phrase_lookahead(name, keyword, answer):
+    """
+    Optional lookahead that captures group `name` when `keyword` and then `answer` follow on the same line.
+    The inner lookahead plus backreference pins the first `keyword` (an atomic group), so the answer is
+    searched for once from there rather than again from every later occurrence of `keyword`.
+    """
+    return rf'(?=(?P<{name}>(?=(?P<{name}_lead>[^\n]*?{keyword}))(?P={name}_lead)[^\n]*?{answer})?)'
+
+
+# At the first "woman" of a line, the optional lookaheads record which of the four answer phrasings
+# (enterprise/owned followed by yes/no on the same line) follow it, so one scan covers all four.
+# The rest of the line is then consumed: a later "woman" on the same line could only find a subset
+# of those phrasings, and re-checking from each one would make long repetitive lines quadratic.
+WOMAN_OWNED_PATTERN = re.compile(
+    'woman'
+    + _phrase_lookahead('enterprise_yes', 'enterprise', 'yes')
+    + _phrase_lookahead('owned_yes', 'owned', 'yes')
+    + _phrase_lookahead('enterprise_no', 'enterprise', 'no')
+    + _phrase_lookahead('owned_no', 'owned', 'no')
+    + r'[^\n]*',
+    re.IGNORECASE,
+)
+WOMAN_OWNED_PROOF_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r"explain.*woman.*enterprise[?:]?\s*([^\n\r]+)",
+    r"woman.*criteria[?:]?\s*([^\n\r]+)",
+))
+LEADING_SEPARATORS_PATTERN = re.compile(r'^[:\-\s]+')
+
+
+def extract_image_text_batch(image_paths, timeout_per_image=60):
+    """
+    OCR many images with a single tesseract run over a list file, instead of starting tesseract per image.
+    Each image goes through prepare_image_for_ocr() first, like in extract_image_text(), so both helpers
+    OCR the same pixels. Returns one text per image, in order. Falls back to extract_image_text() per image
+    when Pillow or the tesseract CLI is missing, an image cannot be prepared, or the output cannot be split
+    back into exactly one page per image.
+    """
+    image_paths = list(image_paths)
+    if not image_paths:
+        return []
+    if Image is None or not shutil.which('tesseract'):
+        return [extract_image_text(image_path) for image_path in image_paths]
+
+    result = None
+    try:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            # Write the prepared images as lossless PNGs, keeping the DPI hint tesseract scales by
+            prepared_paths = []
+            for index, image_path in enumerate(image_paths):
+                prepared_path = os.path.join(temp_dir, f"{index}.png")
+                with Image.open(image_path) as image:
+                    save_options = {'dpi': image.info['dpi']} if 'dpi' in image.info else {}
+                    prepare_image_for_ocr(image).save(prepared_path, **save_options)
+                prepared_paths.append(prepared_path)
+
+            list_file = os.path.join(temp_dir, "images.txt")
+            with open(list_file, 'w', encoding='utf-8') as f:
+                f.write('\n'.join(prepared_paths) + '\n')
+            result = subprocess.run(['tesseract', list_file, '-'], capture_output=True, text=True,
+                                    env=single_threaded_env(), timeout=timeout_per_image * len(image_paths))
+    except Exception:
+        # Unreadable images or a timed-out run: the per-image fallback below reports each image
+        result = None
+
+    # tesseract ends every page with a form feed
+    pages = result.stdout.split('\f') if result and result.returncode == 0 else []
+    if len(pages) == len(image_paths) + 1 and not pages[-1].strip():
+        pages.pop()
+    if len(pages) != len(image_paths):
+        return [extract_image_text(image_path) for image_path in image_paths]
+
+    return [clean_extracted_text(text) if text.strip() else "No text extracted from image" for text in pages]
+
+
 def guess_business_name(content: str, file_name: str):
     """Extract business name from content."""
     if not file_name.lower().startswith("application_info_"):
         return None
 
     # Look for business name patterns
-    patterns = [
-        r"name of your cluster[?:]?\s*([^\n\r?]+)",
-        r"cluster name[?:]?\s*([^\n\r?]+)",
-        r"business name[?:]?\s*([^\n\r?]+)",
-        r"enterprise name[?:]?\s*([^\n\r?]+)"
-    ]
-
-    for pattern in patterns:
-        matches = re.findall(pattern, content, re.IGNORECASE)
-        if matches:
+    for pattern in BUSINESS_NAME_PATTERNS:
+        match = pattern.search(content)
+        if match:
             # Clean up the match
-            name = matches[0].strip()
-            name = re.sub(r'^[:\-\s]+', '', name)  # Remove leading colons, dashes, spaces
+            name = match.group(1).strip()
+            name = LEADING_SEPARATORS_PATTERN.sub('', name)  # Remove leading colons, dashes, spaces
             if len(name) > 3 and not name.isdigit():  # Filter out numbers and very short strings
                 return name
 
@@ -237,31 +530,30 @@ def guess_application_number(content: str, file_name: str):
         return None
 
     # Look for application number patterns
-    patterns = [
-        r"application number[?:]?\s*([A-Z0-9\-]+)",
-        r"KJET[-\s]*([A-Z0-9\-]+)",
-        r"application id[?:]?\s*([A-Z0-9\-]+)"
-    ]
-
-    for pattern in patterns:
-        matches = re.findall(pattern, content, re.IGNORECASE)
-        if matches:
-            return matches[0].strip()
+    for pattern in APPLICATION_NUMBER_PATTERNS:
+        match = pattern.search(content)
+        if match:
+            return match.group(1).strip()
 
     return None
 
 
-def guess_email_address(content: str, file_name: str):
-    """Extract email address from content."""
+def guess_email_address(content: str, file_name: str, emails=None):
+    """
+    Extract email address from content.
+    Pass emails (EMAIL_PATTERN.findall(content)) when it has already been computed to skip the rescan.
+    """
     if not file_name.lower().startswith("application_info_"):
         return None
 
+    if emails is not None:
+        return emails[0] if emails else None
+
     # Look for email patterns
-    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    matches = re.findall(email_pattern, content)
+    match = EMAIL_PATTERN.search(content)
 
-    if matches:
-        return matches[0]  # Return first email found
+    if match:
+        return match.group(0)  # Return first email found
 
     return None
 
@@ -272,16 +564,10 @@ def guess_phone_number(content: str, file_name: str):
         return None
 
     # Look for phone number patterns (Kenyan format)
-    patterns = [
-        r'\b0[17][0-9]{8}\b',  # 07xxxxxxxx or 01xxxxxxxx
-        r'\b\+254[17][0-9]{8}\b',  # +25407xxxxxxxx or +25401xxxxxxxx
-        r'\b254[17][0-9]{8}\b'  # 25407xxxxxxxx or 25401xxxxxxxx
-    ]
-
-    for pattern in patterns:
-        matches = re.findall(pattern, content)
-        if matches:
-            return matches[0]
+    for pattern in PHONE_NUMBER_PATTERNS:
+        match = pattern.search(content)
+        if match:
+            return match.group(0)
 
     return None
 
@@ -292,17 +578,11 @@ def guess_business_type(content: str, file_name: str):
         return None
 
     # Look for business type patterns
-    patterns = [
-        r"registration status[?:]?\s*([^\n\r?]+)",
-        r"business type[?:]?\s*([^\n\r?]+)",
-        r"entity type[?:]?\s*([^\n\r?]+)"
-    ]
-
-    for pattern in patterns:
-        matches = re.findall(pattern, content, re.IGNORECASE)
-        if matches:
-            business_type = matches[0].strip()
-            business_type = re.sub(r'^[:\-\s]+', '', business_type)
+    for pattern in BUSINESS_TYPE_PATTERNS:
+        match = pattern.search(content)
+        if match:
+            business_type = match.group(1).strip()
+            business_type = LEADING_SEPARATORS_PATTERN.sub('', business_type)
             if len(business_type) > 2:
                 return business_type
 
@@ -314,17 +594,15 @@ def guess_woman_owned(content: str, file_name: str):
     if not file_name.lower().startswith("application_info_"):
         return None
 
-    # Look for woman-owned patterns
-    if re.search(r'woman[^\n]*enterprise[^\n]*yes', content, re.IGNORECASE):
-        return "Yes"
-    elif re.search(r'woman[^\n]*owned[^\n]*yes', content, re.IGNORECASE):
-        return "Yes"
-    elif re.search(r'woman[^\n]*enterprise[^\n]*no', content, re.IGNORECASE):
-        return "No"
-    elif re.search(r'woman[^\n]*owned[^\n]*no', content, re.IGNORECASE):
-        return "No"
+    # Look for woman-owned patterns; a "yes" phrasing anywhere wins over any "no" phrasing
+    answer = None
+    for match in WOMAN_OWNED_PATTERN.finditer(content):
+        if match.group('enterprise_yes') or match.group('owned_yes'):
+            return "Yes"
+        if match.group('enterprise_no') or match.group('owned_no'):
+            answer = "No"
 
-    return None
+    return answer
 
 
 def guess_woman_owned_proof(content: str, file_name: str):
@@ -333,21 +611,65 @@ def guess_woman_owned_proof(content: str, file_name: str):
         return None
 
     # Look for explanations of woman-owned criteria
-    patterns = [
-        r"explain.*woman.*enterprise[?:]?\s*([^\n\r]+)",
-        r"woman.*criteria[?:]?\s*([^\n\r]+)"
-    ]
-
-    for pattern in patterns:
-        matches = re.findall(pattern, content, re.IGNORECASE)
-        if matches:
-            proof = matches[0].strip()
+    for pattern in WOMAN_OWNED_PROOF_PATTERNS:
+        match = pattern.search(content)
+        if match:
+            proof = match.group(1).strip()
             if len(proof) > 5:  # Filter out very short responses
                 return proof
 
     return None
 
 
+# Patterns used by extract_structured_data (email addresses reuse EMAIL_PATTERN)
+ANY_PHONE_NUMBER_PATTERN = re.compile(r'\b(?:\+254|254|0)[17][0-9]{8}\b')
+KES_AMOUNT_PATTERN = re.compile(r'KE?S\s*[\d,]+', re.IGNORECASE)
+REGISTRATION_NUMBER_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r'\b[A-Z]{2,3}[-/\s]*[0-9A-Z]{4,}\b',  # General registration patterns
+    r'\bBN[-\s]*[A-Z0-9]{6,}\b',           # Business name patterns
+    r'\bC/S[-\s]*[0-9]{3,}\b',             # Cooperative society patterns
+))
+
+# Sector keywords reported as value_chains_mentioned when they appear anywhere in a document
+VALUE_CHAIN_KEYWORDS = (
+    "agriculture", "livestock", "dairy", "poultry", "fisheries", "aquaculture",
+    "manufacturing", "textiles", "leather", "wood", "furniture", "metal",
+    "construction", "mining", "energy", "water", "transport", "logistics",
+    "ict", "technology", "telecommunications", "financial", "banking",
+    "insurance", "real estate", "professional", "consulting", "legal",
+    "accounting", "engineering", "health", "education", "tourism",
+    "hospitality", "entertainment", "media", "retail", "wholesale",
+    "trade", "import", "export", "services", "repair", "maintenance",
+    "security", "cleaning", "catering", "beauty", "salon", "barber",
+    "tailoring", "crafts", "pottery", "jewelry", "art", "music",
+    "sports", "fitness", "wellness", "spa", "massage", "photography",
+    "printing", "publishing", "advertising", "marketing", "sales",
+    "distribution", "supply", "chain", "warehouse", "storage",
+    "packaging", "recycling", "waste", "environment", "renewable",
+    "solar", "wind", "biogas", "organic", "sustainable", "green",
+    "eco", "climate", "carbon", "emission", "pollution", "conservation",
+)
+
+
+
+@functools.lru_cache(maxsize=None)
+def get_value_chain_automaton():
+    """
+    Build an Aho-Corasick automaton over VALUE_CHAIN_KEYWORDS so a document is scanned once
+    for all keywords. Returns None when pyahocorasick is not installed.
+    """
+    try:
+        import ahocorasick
+    except ImportError:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for keyword in VALUE_CHAIN_KEYWORDS:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+
 def extract_structured_data(content, doc_type, file_name):
     """Extract structured information from document content for LLM analysis"""
 
@@ -362,87 +684,67 @@ def extract_structured_data(content, doc_type, file_name):
         structured_data = {}
 
         # Extract emails
-        emails = re.findall(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', content)
+        emails = EMAIL_PATTERN.findall(content)
         if emails:
             structured_data["email_addresses"] = list(set(emails))
 
-        phones = re.findall(r'\b(?:\+254|254|0)[17][0-9]{8}\b', content)
+        # Only the first 2 phone numbers are kept, so stop scanning once they are found
+        phones = [match.group(0) for match in itertools.islice(ANY_PHONE_NUMBER_PATTERN.finditer(content), 2)]
         if phones:
-            structured_data["phone_numbers"] = list(set(phones[:2]))  # Keep up to 2 phone numbers
+            structured_data["phone_numbers"] = list(set(phones))
 
         # Extract financial amounts (KES format)
-        amounts = re.findall(r'KE?S\s*[\d,]+', content, re.IGNORECASE)
+        amounts = KES_AMOUNT_PATTERN.findall(content)
         if amounts:
             structured_data["financial_amounts"] = list(set(amounts))
 
-        # Try to extract business name using the guess function
-        business_name = guess_business_name(content, file_name)
-        if business_name:
-            structured_data["business_name"] = business_name
-
-        # Try to extract application number
-        app_number = guess_application_number(content, file_name)
-        if app_number:
-            structured_data["application_number"] = app_number
-
-        # Try to extract email using the guess function (more targeted)
-        email = guess_email_address(content, file_name)
-        if email:
-            structured_data["email_address"] = email
-
-        # Try to extract business type
-        business_type = guess_business_type(content, file_name)
-        if business_type:
-            structured_data["business_type"] = business_type
-
-        # Try to extract woman-owned status
-        woman_owned = guess_woman_owned(content, file_name)
-        if woman_owned:
-            structured_data["woman_owned"] = woman_owned
+        # The guess_* helpers only read application_info_* forms; skip them outright for other documents
+        if file_name.lower().startswith("application_info_"):
+            # Try to extract business name using the guess function
+            business_name = guess_business_name(content, file_name)
+            if business_name:
+                structured_data["business_name"] = business_name
+
+            # Try to extract application number
+            app_number = guess_application_number(content, file_name)
+            if app_number:
+                structured_data["application_number"] = app_number
+
+            # Try to extract email using the guess function (reuses the addresses found above)
+            email = guess_email_address(content, file_name, emails)
+            if email:
+                structured_data["email_address"] = email
+
+            # Try to extract business type
+            business_type = guess_business_type(content, file_name)
+            if business_type:
+                structured_data["business_type"] = business_type
+
+            # Try to extract woman-owned status
+            woman_owned = guess_woman_owned(content, file_name)
+            if woman_owned:
+                structured_data["woman_owned"] = woman_owned
 
         # Extract value chain mentions
-        value_chains = [
-            "agriculture", "livestock", "dairy", "poultry", "fisheries", "aquaculture",
-            "manufacturing", "textiles", "leather", "wood", "furniture", "metal",
-            "construction", "mining", "energy", "water", "transport", "logistics",
-            "ict", "technology", "telecommunications", "financial", "banking",
-            "insurance", "real estate", "professional", "consulting", "legal",
-            "accounting", "engineering", "health", "education", "tourism",
-            "hospitality", "entertainment", "media", "retail", "wholesale",
-            "trade", "import", "export", "services", "repair", "maintenance",
-            "security", "cleaning", "catering", "beauty", "salon", "barber",
-            "tailoring", "crafts", "pottery", "jewelry", "art", "music",
-            "sports", "fitness", "wellness", "spa", "massage", "photography",
-            "printing", "publishing", "advertising", "marketing", "sales",
-            "distribution", "supply", "chain", "warehouse", "storage",
-            "packaging", "recycling", "waste", "environment", "renewable",
-            "solar", "wind", "biogas", "organic", "sustainable", "green",
-            "eco", "climate", "carbon", "emission", "pollution", "conservation"
-        ]
-
-        mentioned_chains = []
         content_lower = content.lower()
-        for chain in value_chains:
-            if chain in content_lower:
-                mentioned_chains.append(chain)
+        automaton = get_value_chain_automaton()
+        if automaton is not None:
+            # One pass over the text for every keyword; report them in VALUE_CHAIN_KEYWORDS order
+            found_chains = {keyword for _, keyword in automaton.iter(content_lower)}
+            mentioned_chains = [chain for chain in VALUE_CHAIN_KEYWORDS if chain in found_chains]
+        else:
+            mentioned_chains = [chain for chain in VALUE_CHAIN_KEYWORDS if chain in content_lower]
 
         if mentioned_chains:
             structured_data["value_chains_mentioned"] = mentioned_chains
 
-        # Extract registration numbers
-        reg_patterns = [
-            r'\b[A-Z]{2,3}[-/\s]*[0-9A-Z]{4,}\b',  # General registration patterns
-            r'\bBN[-\s]*[A-Z0-9]{6,}\b',           # Business name patterns
-            r'\bC/S[-\s]*[0-9]{3,}\b'              # Cooperative society patterns
-        ]
-
+        # Extract registration numbers from every pattern, de-duplicated in first-seen order
         all_matches = []
-        for pattern in reg_patterns:
-            matches = re.findall(pattern, content)
-            all_matches.extend(matches)
+        for pattern in REGISTRATION_NUMBER_PATTERNS:
+            all_matches.extend(pattern.findall(content))
 
         if all_matches:
-            structured_data["registration_numbers"] = list(set(matches))
+            structured_data["registration_numbers"] = list(dict.fromkeys(all_matches))
 
         data["structured_data"] = structured_data
 
@@ -463,19 +765,31 @@ def load_selection_criteria():
     return "Selection criteria file not found"
 
 
+# County folders are listed concurrently; the scan is dominated by directory reads
+DISCOVERY_THREADS = 32
+
+
+def list_application_folders(folder):
+    """Return the application bundle folders directly inside folder, using a single os.scandir pass."""
+    with os.scandir(folder) as entries:
+        return [Path(entry.path) for entry in entries if entry.is_dir() and is_application_folder_name(entry.name)]
+
+
 def discover_counties_and_applications(data_dir):
     """Discover county subfolders and application folders"""
     counties_data = {}
 
-    # Check if data_dir contains county subfolders or direct application folders
-    items = list(data_dir.iterdir())
+    # Check if data_dir contains county subfolders or direct application folders.
+    # os.scandir entries usually know whether they are directories without an extra stat() call.
+    with os.scandir(data_dir) as entries:
+        folder_names = [entry.name for entry in entries if entry.is_dir()]
 
     # Look for application folders directly in data_dir (legacy structure)
     # Use regex to handle folders like application_387_bundle (1)
-    direct_applications = [item for item in items if item.is_dir() and is_application_folder_name(item.name)]
+    direct_applications = [data_dir / name for name in folder_names if is_application_folder_name(name)]
 
     # Look for county subfolders
-    county_folders = [item for item in items if item.is_dir() and not is_application_folder_name(item.name) and not item.name.startswith(".")]
+    county_folders = [name for name in folder_names if not is_application_folder_name(name) and not name.startswith(".")]
 
     if direct_applications and not county_folders:
         # Legacy structure: applications directly in data folder
@@ -484,12 +798,14 @@ def discover_counties_and_applications(data_dir):
     else:
         # New structure: county subfolders containing applications
         print("Scanning for county subfolders...")
-        for item in items:
-            if item.is_dir() and not item.name.startswith("."):
-                # Check if this folder contains application folders (handle folders with (1) suffix)
-                sub_applications = [sub for sub in item.iterdir()
-                                 if sub.is_dir() and is_application_folder_name(sub.name)]
-                county_name = item.name
+        county_names = [name for name in folder_names if not name.startswith(".")]
+
+        # Check each folder for application folders (handle folders with (1) suffix), several at a time
+        max_workers = max(1, min(DISCOVERY_THREADS, len(county_names)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            county_applications = executor.map(list_application_folders, [data_dir / name for name in county_names])
+
+            for county_name, sub_applications in zip(county_names, county_applications):
                 counties_data[county_name] = sub_applications
                 if sub_applications:
                     print(f"  Found county: {county_name} with {len(sub_applications)} applications")
@@ -505,32 +821,45 @@ def discover_counties_and_applications(data_dir):
     return counties_data
 
 
+@functools.lru_cache(maxsize=None)
 def check_dependencies():
-    """Check if required dependencies are available"""
+    """Check if required dependencies are available (checked once per process; later calls reuse the result)"""
     current_dir = Path(__file__).parent.parent.parent  # Go up from scripts/extraction/ to project root
     venv_path = current_dir / "venv"
 
     required_packages = {
         'tqdm': 'tqdm',
         'PyPDF2': 'PyPDF2',
-        'Pillow': 'Pillow',
+        'PIL': 'Pillow',
         'pytesseract': 'pytesseract',
     }
 
+    # Faster PDF backends that extract_pdf_text uses when present; never auto-installed
+    optional_packages = {
+        'fitz': 'PyMuPDF',
+        'pypdfium2': 'pypdfium2',
+    }
+
     missing_packages = []
 
+    # find_spec only locates the package; it does not run its import-time initialization
     for import_name, package_name in required_packages.items():
-        try:
-            __import__(import_name)
-        except ImportError:
+        if importlib.util.find_spec(import_name) is None:
             missing_packages.append(package_name)
 
+    missing_optional = [package_name for import_name, package_name in optional_packages.items()
+                        if importlib.util.find_spec(import_name) is None]
+    if missing_optional:
+        print(f"ℹ️  Optional packages not installed (slower fallbacks will be used): {', '.join(missing_optional)}")
+
     if missing_packages:
         print(f"⚠️  Missing packages: {', '.join(missing_packages)}")
         if venv_path.exists():
             print("Installing missing packages...")
-            for package in missing_packages:
-                install_package(package)
+            installed = [package for package in missing_packages if install_package(package)]
+            if installed:
+                # The extractors read the module-level backends, which are still None for these packages
+                rebind_missing_backends()
         else:
             print("Please install the missing packages or create a virtual environment.")
             return False
@@ -4,10 +4,39 @@ Financial utilities for KJET document extraction.
 Contains specialized functions for extracting and processing financial documents.
 """
 
+import functools
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
 from pathlib import Path
 
+# Optional backends are imported once here; functions check for None instead of importing per call
+try:
+    import fitz  # PyMuPDF
+except ImportError:
+    fitz = None
+
+try:
+    import PyPDF2
+except ImportError:
+    PyPDF2 = None
+
+try:
+    import pytesseract
+except ImportError:
+    pytesseract = None
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+try:
+    from pdf2image import convert_from_path, pdfinfo_from_path
+except ImportError:
+    convert_from_path = pdfinfo_from_path = None
+
 # Financial document type patterns
 FINANCIAL_PATTERNS = {
     'bank_statements': [
@@ -53,6 +82,21 @@ FINANCIAL_PATTERNS = {
     ]
 }
 
+def lowercase_minimal_patterns(patterns):
+    """
+    Lowercase filename patterns and keep only those that do not contain another pattern of the
+    same list: any name matching "bank statement" also matches "statement", so the longer one is never needed.
+    """
+    lowered = tuple(dict.fromkeys(pattern.lower() for pattern in patterns))
+    return tuple(pattern for pattern in lowered
+                 if not any(other != pattern and other in pattern for other in lowered))
+
+# FINANCIAL_PATTERNS reduced once at import to the lowercased patterns that decide a match, in order
+FINANCIAL_PATTERNS_LOWERCASE = tuple(
+    (doc_type, lowercase_minimal_patterns(patterns))
+    for doc_type, patterns in FINANCIAL_PATTERNS.items()
+)
+
 # Key financial terms to search for
 FINANCIAL_KEYWORDS = [
     'total', 'totals', 'revenue', 'assets', 'profit', 'loss',
@@ -61,64 +105,143 @@ FINANCIAL_KEYWORDS = [
     'current assets', 'fixed assets', 'equity', 'retained earnings',
     'cash flow', 'turnover', 'sales', 'cost of goods sold'
 ]
+# Matches a line (already lowercased) that contains any of the keywords, in one scan instead of one per keyword
+FINANCIAL_KEYWORDS_PATTERN = re.compile('|'.join(re.escape(keyword) for keyword in FINANCIAL_KEYWORDS))
+# Context lines are kept when they contain a digit; frozenset.isdisjoint checks that in C, no regex needed
+DIGITS = frozenset('0123456789')
+
+# M-Pesa section headings, tried in order; the first one present wins. ("ACCOUNT SUMMARY" and
+# "Account Summary" are not listed: they contain "SUMMARY"/"Summary", which are tried first.)
+MPESA_SUMMARY_HEADINGS = ('SUMMARY', 'Summary')
+MPESA_DETAIL_HEADINGS = ('DETAILED STATEMENT', 'Detailed Statement', 'TRANSACTION DETAILS', 'Transaction Details', 'TRANSACTIONS')
+
+# Common M-Pesa summary patterns, used when a statement has no SUMMARY section
+MPESA_SUMMARY_KEYWORDS = (
+    'Statement Period:', 'Customer Name:', 'Phone Number:',
+    'Opening Balance:', 'Closing Balance:', 'Total Received:',
+    'Total Paid:', 'Total Charges:', 'Account Balance:'
+)
 
 def classify_financial_document(filename):
     """
     Classify a financial document based on its filename.
     Returns the document type and a cleaned name.
     """
-    filename_lower = filename.lower()
+    return classify_lowercase_filename(filename.lower()), filename
 
+@functools.lru_cache(maxsize=4096)
+def classify_lowercase_filename(filename_lower):
+    """
+    Return the financial document type for a filename that is already lowercased,
+    so callers that need the lowercased name anyway only lowercase it once.
+    Results are cached: bundles repeat the same document names across applications.
+    """
     # Check each pattern type
-    for doc_type, patterns in FINANCIAL_PATTERNS.items():
+    for doc_type, patterns in FINANCIAL_PATTERNS_LOWERCASE:
         for pattern in patterns:
-            if pattern.lower() in filename_lower:
-                return doc_type, filename
+            if pattern in filename_lower:
+                return doc_type
 
     # Default classification for unmatched files
-    return 'other_financial', filename
+    return 'other_financial'
 
 def extract_first_and_last_pages(pdf_path, num_last_pages=2):
     """
     Extract text from the first page and last two pages of a PDF.
     This captures summary information while avoiding lengthy transaction details.
+    PyMuPDF is used when installed (it only parses the pages it reads); PyPDF2 is the fallback.
     """
     try:
-        import PyPDF2
+        if fitz is not None:
+            try:
+                with fitz.open(str(pdf_path)) as doc:
+                    return format_first_and_last_pages(
+                        doc.page_count, lambda index: doc.load_page(index).get_text(), num_last_pages
+                    )
+            except Exception:
+                pass  # Let PyPDF2 have a go at PDFs MuPDF cannot read
+
+        if PyPDF2 is None:
+            raise ImportError("PyPDF2 is not installed")
 
         with open(pdf_path, 'rb') as file:
             pdf_reader = PyPDF2.PdfReader(file)
-            num_pages = len(pdf_reader.pages)
-
-            extracted_pages = []
-
-            # Extract first page
-            if num_pages > 0:
-                first_page = pdf_reader.pages[0]
-                first_text = first_page.extract_text()
-                if first_text.strip():
-                    extracted_pages.append(f"=== First Page ===\n{first_text.strip()}")
-
-            # Extract last pages (up to num_last_pages)
-            if num_pages > 1:
-                pages_to_extract = min(num_last_pages, num_pages - 1)  # Don't double-extract first page
-                start_page = max(1, num_pages - pages_to_extract)  # Start from appropriate page
-
-                for i in range(start_page, num_pages):
-                    page = pdf_reader.pages[i]
-                    page_text = page.extract_text()
-                    if page_text.strip():
-                        page_label = f"Last Page {i - start_page + 1}" if pages_to_extract > 1 else "Last Page"
-                        extracted_pages.append(f"=== {page_label} ===\n{page_text.strip()}")
-
-            if extracted_pages:
-                return "\n\n".join(extracted_pages) + f"\n[First and Last {num_last_pages} Pages Extracted]"
-            else:
-                return "ERROR: No text found in first/last pages"
+            return format_first_and_last_pages(
+                len(pdf_reader.pages), lambda index: pdf_reader.pages[index].extract_text(), num_last_pages
+            )
 
     except Exception as e:
         return f"ERROR: Failed to extract first/last pages: {str(e)}"
 
+def format_first_and_last_pages(num_pages, get_page_text, num_last_pages):
+    """
+    Build the first/last pages extract from a page count and a function returning the text of a page index.
+    """
+    extracted_pages = []
+
+    # Extract first page
+    if num_pages > 0:
+        first_text = get_page_text(0).strip()
+        if first_text:
+            extracted_pages.append(f"=== First Page ===\n{first_text}")
+
+    # Extract last pages (up to num_last_pages)
+    if num_pages > 1:
+        pages_to_extract = min(num_last_pages, num_pages - 1)  # Don't double-extract first page
+        start_page = max(1, num_pages - pages_to_extract)  # Start from appropriate page
+
+        for i in range(start_page, num_pages):
+            page_text = get_page_text(i).strip()
+            if page_text:
+                page_label = f"Last Page {i - start_page + 1}" if pages_to_extract > 1 else "Last Page"
+                extracted_pages.append(f"=== {page_label} ===\n{page_text}")
+
+    if extracted_pages:
+        return "\n\n".join(extracted_pages) + f"\n[First and Last {num_last_pages} Pages Extracted]"
+    else:
+        return "ERROR: No text found in first/last pages"
+
+@functools.lru_cache(maxsize=None)
+def get_financial_keyword_automaton():
+    """
+    Build an Aho-Corasick automaton over FINANCIAL_KEYWORDS so a document is scanned once
+    for all keywords. Returns None when pyahocorasick is not installed.
+    """
+    try:
+        import ahocorasick
+    except ImportError:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for keyword in FINANCIAL_KEYWORDS:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+def find_financial_keyword_lines(text_content):
+    """
+    Return the indexes of the lines (text_content split on newlines) that contain a financial keyword.
+    The whole lowercased document is scanned in one pass, with an Aho-Corasick automaton when
+    pyahocorasick is installed and FINANCIAL_KEYWORDS_PATTERN otherwise.
+    """
+    # Lowercasing never adds or removes newlines, so positions in the lowered text map to the same lines
+    lowered = text_content.lower()
+    automaton = get_financial_keyword_automaton()
+    if automaton is None:
+        end_indexes = (match.end() - 1 for match in FINANCIAL_KEYWORDS_PATTERN.finditer(lowered))
+    else:
+        end_indexes = (end_index for end_index, _ in automaton.iter(lowered))
+
+    # Hits arrive in text order, so the line number only needs the newlines since the previous hit
+    line_indexes = set()
+    line_index = 0
+    position = 0
+    for end_index in end_indexes:
+        line_index += lowered.count('\n', position, end_index)
+        position = end_index
+        line_indexes.add(line_index)
+    return line_indexes
+
 def extract_financial_keywords(text_content):
     """
     Extract lines containing key financial terms like totals, revenue, assets, profit/loss.
@@ -127,53 +250,57 @@ def extract_financial_keywords(text_content):
     if not text_content or text_content.startswith("ERROR:"):
         return text_content
 
+    keyword_line_indexes = find_financial_keyword_lines(text_content)
+    if not keyword_line_indexes:
+        # Fallback: return original content truncated (without splitting it into lines first)
+        return text_content[:3000] + "...\n[No specific financial keywords found]"
+
     lines = text_content.split('\n')
+    # Collected lines stay unique as they are added; `seen` answers membership without scanning the list
     financial_lines = []
+    seen = set()
 
-    # Look for lines containing financial keywords
-    for line in lines:
-        line_clean = line.strip()
-        if not line_clean:
-            continue
+    # Visit the lines containing financial keywords, in document order
+    for line_index in sorted(keyword_line_indexes):
+        line_clean = lines[line_index].strip()
+
+        # Include the line and potentially context lines
+        is_new_line = line_clean not in seen
+        if is_new_line:
+            financial_lines.append(line_clean)
+            seen.add(line_clean)
+
+        # Look for numerical values in nearby lines (context)
+        # Check previous line for context; it goes just before the keyword line it belongs to
+        if line_index > 0:
+            prev_line = lines[line_index - 1].strip()
+            if prev_line and not DIGITS.isdisjoint(prev_line):
+                if prev_line not in seen:
+                    if is_new_line:
+                        financial_lines.insert(-1, prev_line)
+                    else:
+                        financial_lines.append(prev_line)
+                    seen.add(prev_line)
 
-        # Check if line contains any financial keywords
-        line_lower = line_clean.lower()
-        for keyword in FINANCIAL_KEYWORDS:
-            if keyword in line_lower:
-                # Include the line and potentially context lines
-                financial_lines.append(line_clean)
-
-                # Look for numerical values in nearby lines (context)
-                line_index = lines.index(line)
-
-                # Check previous line for context
-                if line_index > 0:
-                    prev_line = lines[line_index - 1].strip()
-                    if prev_line and re.search(r'\d+', prev_line):
-                        if prev_line not in financial_lines:
-                            financial_lines.insert(-1, prev_line)
-
-                # Check next line for context
-                if line_index < len(lines) - 1:
-                    next_line = lines[line_index + 1].strip()
-                    if next_line and re.search(r'\d+', next_line):
-                        if next_line not in financial_lines:
-                            financial_lines.append(next_line)
-                break
+        # Check next line for context
+        if line_index < len(lines) - 1:
+            next_line = lines[line_index + 1].strip()
+            if next_line and not DIGITS.isdisjoint(next_line):
+                if next_line not in seen:
+                    financial_lines.append(next_line)
+                    seen.add(next_line)
 
-    # Remove duplicates while preserving order
-    unique_financial_lines = []
-    seen = set()
-    for line in financial_lines:
-        if line not in seen:
-            unique_financial_lines.append(line)
-            seen.add(line)
+    return "\n".join(financial_lines) + "\n[Key Financial Information Extracted]"
 
-    if unique_financial_lines:
-        return "\n".join(unique_financial_lines) + "\n[Key Financial Information Extracted]"
-    else:
-        # Fallback: return original content truncated
-        return text_content[:3000] + "...\n[No specific financial keywords found]"
+def ocr_page_images(images):
+    """
+    OCR page images concurrently and return their texts in page order.
+    Each pytesseract call runs its own tesseract process, so the pages overlap instead of queueing.
+    """
+    if len(images) <= 1:
+        return [pytesseract.image_to_string(image) for image in images]
+    with ThreadPoolExecutor(max_workers=len(images)) as executor:
+        return list(executor.map(pytesseract.image_to_string, images))
 
 def extract_pdf_with_ocr(pdf_path, first_last_only=True, num_last_pages=2):
     """
@@ -182,32 +309,24 @@ def extract_pdf_with_ocr(pdf_path, first_last_only=True, num_last_pages=2):
     If first_last_only=True, only processes first and last pages.
     """
     try:
-        # Try to import required libraries
-        import pytesseract
-        from PIL import Image
+        # Check required libraries
+        if pytesseract is None or Image is None:
+            raise ImportError("No module named 'pytesseract' or 'PIL'")
 
         # Try pdf2image first (more reliable)
-        try:
-            from pdf2image import convert_from_path
-
+        if convert_from_path is not None:
             if first_last_only:
-                # Get total page count first
+                # Get total page count first (pdfinfo reads it without rendering anything)
                 try:
-                    info_pages = convert_from_path(str(pdf_path), first_page=1, last_page=1, dpi=150)
+                    total_pages = pdfinfo_from_path(str(pdf_path))['Pages']
                     # Get first page
                     first_pages = convert_from_path(str(pdf_path), first_page=1, last_page=1, dpi=200)
 
-                    # Get last pages
+                    # Get last pages in one pdftoppm run, never repeating the first page
                     last_pages = []
-                    try:
-                        # Try to get specific last pages
-                        for i in range(num_last_pages):
-                            page_num = -(i + 1)  # -1 for last page, -2 for second to last, etc.
-                            page = convert_from_path(str(pdf_path), first_page=page_num, last_page=page_num, dpi=200)
-                            last_pages.extend(page)
-                    except:
-                        # Fallback: get last few pages
-                        last_pages = convert_from_path(str(pdf_path), first_page=-num_last_pages, last_page=-1, dpi=200)
+                    if total_pages > 1:
+                        last_pages = convert_from_path(str(pdf_path), first_page=max(2, total_pages - num_last_pages + 1),
+                                                       last_page=total_pages, dpi=200)
 
                     pages = first_pages + last_pages
                 except:
@@ -218,9 +337,8 @@ def extract_pdf_with_ocr(pdf_path, first_last_only=True, num_last_pages=2):
                 pages = convert_from_path(str(pdf_path), first_page=1, last_page=3, dpi=200)
 
             extracted_texts = []
-            for i, page in enumerate(pages):
-                # Apply OCR to each page
-                text = pytesseract.image_to_string(page)
+            # Apply OCR to all pages at once
+            for i, text in enumerate(ocr_page_images(pages)):
                 if text.strip():
                     if first_last_only and len(pages) > 1:
                         page_label = "First Page" if i == 0 else f"Last Page {i}"
@@ -233,50 +351,46 @@ def extract_pdf_with_ocr(pdf_path, first_last_only=True, num_last_pages=2):
             else:
                 return "No text found via OCR"
 
-        except ImportError:
-            # Fallback: try using PyMuPDF if available
-            try:
-                import fitz  # PyMuPDF
-
-                doc = fitz.open(str(pdf_path))
-                extracted_texts = []
-
-                pages_to_process = []
-                if first_last_only:
-                    # First page
-                    pages_to_process.append(0)
-                    # Last pages
-                    for i in range(min(num_last_pages, len(doc))):
-                        page_num = len(doc) - 1 - i
-                        if page_num > 0:  # Don't duplicate first page
-                            pages_to_process.append(page_num)
-                else:
-                    pages_to_process = list(range(min(3, len(doc))))
-
-                for page_num in pages_to_process:
-                    page = doc[page_num]
-                    pix = page.get_pixmap(matrix=fitz.Matrix(2, 2))  # 2x scaling for better OCR
-                    img_data = pix.tobytes("ppm")
-
-                    # Convert to PIL Image
-                    from io import BytesIO
-                    img = Image.open(BytesIO(img_data))
-
-                    # Apply OCR
-                    text = pytesseract.image_to_string(img)
-                    if text.strip():
-                        page_label = f"Page {page_num + 1}"
-                        extracted_texts.append(f"=== {page_label} ===\n{text.strip()}")
-
-                doc.close()
-
-                if extracted_texts:
-                    return "\n\n".join(extracted_texts) + "\n[Extracted via OCR - PyMuPDF]"
-                else:
-                    return "No text found via OCR"
-
-            except ImportError:
-                return "OCR libraries not available (pdf2image, PyMuPDF, or pytesseract missing)"
+        # Fallback: try using PyMuPDF if available
+        if fitz is not None:
+            doc = fitz.open(str(pdf_path))
+            extracted_texts = []
+
+            pages_to_process = []
+            if first_last_only:
+                # First page
+                pages_to_process.append(0)
+                # Last pages
+                for i in range(min(num_last_pages, len(doc))):
+                    page_num = len(doc) - 1 - i
+                    if page_num > 0:  # Don't duplicate first page
+                        pages_to_process.append(page_num)
+            else:
+                pages_to_process = list(range(min(3, len(doc))))
+
+            images = []
+            for page_num in pages_to_process:
+                page = doc[page_num]
+                pix = page.get_pixmap(matrix=fitz.Matrix(2, 2))  # 2x scaling for better OCR
+                img_data = pix.tobytes("ppm")
+
+                # Convert to PIL Image
+                images.append(Image.open(BytesIO(img_data)))
+
+            # Apply OCR to all pages at once
+            for page_num, text in zip(pages_to_process, ocr_page_images(images)):
+                if text.strip():
+                    page_label = f"Page {page_num + 1}"
+                    extracted_texts.append(f"=== {page_label} ===\n{text.strip()}")
+
+            doc.close()
+
+            if extracted_texts:
+                return "\n\n".join(extracted_texts) + "\n[Extracted via OCR - PyMuPDF]"
+            else:
+                return "No text found via OCR"
+
+        return "OCR libraries not available (pdf2image, PyMuPDF, or pytesseract missing)"
 
     except Exception as e:
         return f"OCR extraction failed: {str(e)}"
@@ -296,12 +410,9 @@ def clean_financial_text(text_content, doc_type, filename):
     # Handle M-Pesa statements specially - extract content between SUMMARY and DETAILED STATEMENT
     if doc_type == 'mpesa_statements':
         # Look for SUMMARY section specifically
-        summary_start_patterns = ['SUMMARY', 'Summary', 'ACCOUNT SUMMARY', 'Account Summary']
-        detailed_start_patterns = ['DETAILED STATEMENT', 'Detailed Statement', 'TRANSACTION DETAILS', 'Transaction Details', 'TRANSACTIONS']
-
         # Find the SUMMARY section start
         summary_start_pos = -1
-        for pattern in summary_start_patterns:
+        for pattern in MPESA_SUMMARY_HEADINGS:
             pos = text_content.find(pattern)
             if pos != -1:
                 summary_start_pos = pos
@@ -310,9 +421,9 @@ def clean_financial_text(text_content, doc_type, filename):
         if summary_start_pos != -1:
             # Find the DETAILED STATEMENT section start (end of summary)
             detailed_start_pos = len(text_content)  # Default to end of text
-            for pattern in detailed_start_patterns:
+            for pattern in MPESA_DETAIL_HEADINGS:
                 pos = text_content.find(pattern, summary_start_pos)
-                if pos != -1 and pos < detailed_start_pos:
+                if pos != -1:
                     detailed_start_pos = pos
                     break
 
@@ -326,24 +437,16 @@ def clean_financial_text(text_content, doc_type, filename):
         lines = text_content.split('\n')
         summary_lines = []
 
-        # Common M-Pesa summary patterns
-        summary_keywords = [
-            'Statement Period:', 'Customer Name:', 'Phone Number:',
-            'Opening Balance:', 'Closing Balance:', 'Total Received:',
-            'Total Paid:', 'Total Charges:', 'Account Balance:'
-        ]
-
-        for line in lines[:150]:  # Check first 150 lines
+        for line_index, line in enumerate(lines[:150]):  # Check first 150 lines
             line_clean = line.strip()
 
             # Capture lines with key M-Pesa information
-            if any(keyword in line_clean for keyword in summary_keywords):
+            if any(keyword in line_clean for keyword in MPESA_SUMMARY_KEYWORDS):
                 summary_lines.append(line_clean)
                 # Also capture the next line which often contains the value
-                line_index = lines.index(line)
                 if line_index + 1 < len(lines):
                     next_line = lines[line_index + 1].strip()
-                    if next_line and not any(keyword in next_line for keyword in summary_keywords):
+                    if next_line and not any(keyword in next_line for keyword in MPESA_SUMMARY_KEYWORDS):
                         summary_lines.append(next_line)
 
         if summary_lines:
@@ -373,6 +476,22 @@ def clean_financial_text(text_content, doc_type, filename):
                 return text_content[:4000] + "...\n[Truncated for length]"
             return text_content
 
+def iter_pdf_files(folder):
+    """
+    Yield every *.pdf file under folder, recursively, using os.scandir so directory entries
+    are only turned into Path objects when they are PDFs. Like Path.rglob, symlinked directories
+    are not descended into (no duplicates, no symlink loops) and unreadable directories are skipped.
+    """
+    try:
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from iter_pdf_files(entry.path)
+                elif entry.name.endswith(".pdf"):
+                    yield Path(entry.path)
+    except OSError:
+        return
+
 def find_financial_documents(app_folder):
     """
     Find all financial documents in an application folder.
@@ -381,11 +500,12 @@ def find_financial_documents(app_folder):
     financial_docs = []
 
     # Look for PDFs in the application folder and subdirectories
-    for pdf_path in app_folder.rglob("*.pdf"):
+    for pdf_path in iter_pdf_files(app_folder):
         # Skip application_info files and registration files
-        filename_lower = pdf_path.name.lower()
-        if (pdf_path.name.startswith("application_info_") or
-            pdf_path.name.startswith("Registration_Certificate_") or
+        # (Registration_Certificate_ files are caught by the "registration" check)
+        filename = pdf_path.name
+        filename_lower = filename.lower()
+        if (filename.startswith("application_info_") or
             "registration" in filename_lower or
             "certificate" in filename_lower or
             "license" in filename_lower or
@@ -393,8 +513,9 @@ def find_financial_documents(app_folder):
             continue
 
         # Check if this looks like a financial document
-        doc_type, _ = classify_financial_document(pdf_path.name)        # Only include actual financial documents
-        if doc_type != 'other_financial' or any(keyword in pdf_path.name.lower()
+        doc_type = classify_lowercase_filename(filename_lower)
+        # Only include actual financial documents
+        if doc_type != 'other_financial' or any(keyword in filename_lower
                                               for keyword in ['statement', 'balance', 'income', 'financial', 'bank', 'mpesa', 'cash']):
             financial_docs.append((pdf_path, doc_type))
 
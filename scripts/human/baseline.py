@@ -4,16 +4,62 @@ Extract JSON data from kjet-human.csv containing application ID, county, weighte
 """
 
 import csv
+import functools
+import hashlib
 import json
 import os
 import sys
 import argparse
+from operator import itemgetter
 from path_utils import resolve_csv_path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Import standardized counties list
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'utils'))
 from counties import counties
 
+# County name mappings for common variations
+COUNTY_MAPPINGS = {
+    'Elgeyo-Marakwet': 'Elgeyo Marakwet',
+    'Nairobi .': 'Nairobi',
+    'kiambu': 'Kiambu',
+    'kitui': 'Kitui',
+    'MIGORI': 'Migori',
+    'Mgori': 'Migori',
+    'Homabay': 'Homa Bay',
+    'West pokot': 'West Pokot',
+    'N/A': 'Unknown',  # Assign to Unknown county instead of filtering out
+    'Unknown': 'Unknown',  # Handle already assigned Unknown
+}
+
+OFFICIAL_COUNTIES = frozenset(counties)
+CANONICAL_COUNTIES_BY_UPPER = {county.upper(): county for county in counties}
+
+@functools.lru_cache(maxsize=None)
+def standardize_county_name(county):
+    """
+    Map a single county spelling to its official name.
+
+    Returns:
+        tuple: (standardized name, whether the spelling was fixed)
+    """
+    if county in COUNTY_MAPPINGS:
+        return COUNTY_MAPPINGS[county], True
+
+    normalized_county = ' '.join(str(county).replace('-', ' ').strip().rstrip('.').split())
+    if normalized_county in COUNTY_MAPPINGS:
+        return COUNTY_MAPPINGS[normalized_county], True
+
+    canonical_name = CANONICAL_COUNTIES_BY_UPPER.get(normalized_county.upper())
+    if canonical_name is not None and canonical_name != county:
+        return canonical_name, True
+
+    return county, False
+
 def standardize_county_names(applicants):
     """
     Standardize county names to match the official county list.
@@ -24,43 +70,21 @@ def standardize_county_names(applicants):
     Returns:
         list: Updated applicants list with standardized county names
     """
-    # Define county name mappings for common variations
-    county_mappings = {
-        'Elgeyo-Marakwet': 'Elgeyo Marakwet',
-        'Nairobi .': 'Nairobi',
-        'kiambu': 'Kiambu',
-        'kitui': 'Kitui',
-        'MIGORI': 'Migori',
-        'Mgori': 'Migori',
-        'Homabay': 'Homa Bay',
-        'West pokot': 'West Pokot',
-        'N/A': 'Unknown',  # Assign to Unknown county instead of filtering out
-        'Unknown': 'Unknown',  # Handle already assigned Unknown
-    }
-
-    canonical_by_upper = {county.upper(): county for county in counties}
-
     fixed_count = 0
+    fixes = {}
     problematic_applicants = []
 
     for applicant in applicants:
         original_county = applicant['county']
-        normalized_county = ' '.join(str(original_county).replace('-', ' ').strip().rstrip('.').split())
+        county, fixed = standardize_county_name(original_county)
 
-        if original_county in county_mappings:
-            applicant['county'] = county_mappings[original_county]
-            fixed_count += 1
-            print(f"✅ Fixed: '{original_county}' → '{county_mappings[original_county]}' for {applicant['application_id']}")
-        elif normalized_county in county_mappings:
-            applicant['county'] = county_mappings[normalized_county]
+        if fixed:
+            applicant['county'] = county
             fixed_count += 1
-            print(f"✅ Fixed: '{original_county}' → '{county_mappings[normalized_county]}' for {applicant['application_id']}")
-        elif normalized_county.upper() in canonical_by_upper:
-            canonical_name = canonical_by_upper[normalized_county.upper()]
-            if canonical_name != original_county:
-                applicant['county'] = canonical_name
-                fixed_count += 1
-                print(f"✅ Fixed: '{original_county}' → '{canonical_name}' for {applicant['application_id']}")
+            fixes[(original_county, county)] = fixes.get((original_county, county), 0) + 1
+
+    for (original_county, county), count in fixes.items():
+        print(f"✅ Fixed: '{original_county}' → '{county}' for {count} applicant(s)")
 
     if fixed_count > 0:
         print(f"\n🔧 Standardized {fixed_count} county names")
@@ -81,66 +105,41 @@ def add_county_rankings(applicants):
     Returns:
         list: Updated applicants list with county_rank field
     """
-    # Track unmatched county names
-    unmatched_counties = set()
-    matched_counties = set()
-
-    # Group applicants by county
-    county_groups = {}
-    for applicant in applicants:
-        county = applicant['county']
-        if county not in county_groups:
-            county_groups[county] = []
-        county_groups[county].append(applicant)
-
-        # Check if county matches standardized list
-        if county in counties:
-            matched_counties.add(county)
-        else:
-            unmatched_counties.add(county)
-
-    # Rank applicants within each county
+    # Count applicants per county
+    county_sizes = {}
+    for county in map(itemgetter('county'), applicants):
+        county_sizes[county] = county_sizes.get(county, 0) + 1
+
+    # Check each distinct county against the standardized list
+    matched_counties = OFFICIAL_COUNTIES.intersection(county_sizes)
+    unmatched_counties = {county for county in county_sizes if county not in OFFICIAL_COUNTIES}
+
+    # Order every applicant once by weighted_score (descending - highest first).
+    # Only scores >= 0 are ranked, so applicants without scores (0) land at the
+    # end by themselves; the sort is stable, so ties keep their CSV order.
+    ranking_order = [app for app in applicants if app['weighted_score'] >= 0]
+    ranking_order.sort(key=itemgetter('weighted_score'), reverse=True)
+
+    # Assign county rankings by walking the global order with a per-county counter
     county_rank_validation_errors = []
+    next_county_rank = {}
 
-    for county, county_applicants in county_groups.items():
-        total_applicants_in_county = len(county_applicants)
-
-        # Separate applicants with scores > 0 and scores = 0
-        with_scores = [app for app in county_applicants if app['weighted_score'] > 0]
-        without_scores = [app for app in county_applicants if app['weighted_score'] == 0]
-
-        # Sort applicants with scores by weighted_score (descending - highest first)
-        with_scores.sort(key=lambda x: x['weighted_score'], reverse=True)
-
-        # Assign county rankings
-        rank = 1
-
-        # First, rank those with scores
-        for applicant in with_scores:
-            if rank > total_applicants_in_county:
-                county_rank_validation_errors.append({
-                    'county': county,
-                    'applicant_id': applicant['application_id'],
-                    'assigned_rank': rank,
-                    'max_possible_rank': total_applicants_in_county
-                })
-            applicant['county_rank'] = rank
-            rank += 1
-
-        # Then, add those without scores at the end
-        for applicant in without_scores:
-            if rank > total_applicants_in_county:
-                county_rank_validation_errors.append({
-                    'county': county,
-                    'applicant_id': applicant['application_id'],
-                    'assigned_rank': rank,
-                    'max_possible_rank': total_applicants_in_county
-                })
-            applicant['county_rank'] = rank
-            rank += 1
-
-        # Validate that the final rank equals total applicants (since ranks should be 1 to N)
-        max_rank_assigned = max([app['county_rank'] for app in county_applicants]) if county_applicants else 0
+    for applicant in ranking_order:
+        county = applicant['county']
+        rank = next_county_rank.get(county, 1)
+        if rank > county_sizes[county]:
+            county_rank_validation_errors.append({
+                'county': county,
+                'applicant_id': applicant['application_id'],
+                'assigned_rank': rank,
+                'max_possible_rank': county_sizes[county]
+            })
+        applicant['county_rank'] = rank
+        next_county_rank[county] = rank + 1
+
+    # Validate that the final rank equals total applicants (since ranks should be 1 to N)
+    for county, total_applicants_in_county in county_sizes.items():
+        max_rank_assigned = next_county_rank.get(county, 1) - 1
         if max_rank_assigned != total_applicants_in_county:
             print(f"⚠️  WARNING: County '{county}' has {total_applicants_in_county} applicants but max rank assigned is {max_rank_assigned}")
 
@@ -155,7 +154,7 @@ def add_county_rankings(applicants):
 
     # Print county validation results
     print(f"\n=== County Validation Results ===")
-    print(f"Total counties found in data: {len(county_groups)}")
+    print(f"Total counties found in data: {len(county_sizes)}")
     print(f"Expected counties from standardized list: {len(counties)}")
     print(f"Matched counties: {len(matched_counties)}")
     print(f"Unmatched counties: {len(unmatched_counties)}")
@@ -167,7 +166,7 @@ def add_county_rankings(applicants):
         print("\nThese counties should be standardized to match the official county names.")
 
     # Show missing counties from the standardized list
-    missing_counties = set(counties) - matched_counties
+    missing_counties = OFFICIAL_COUNTIES - matched_counties
     if missing_counties:
         print(f"\nℹ️  INFO: {len(missing_counties)} standardized counties not found in data:")
         for county in sorted(missing_counties):
@@ -175,7 +174,7 @@ def add_county_rankings(applicants):
 
     # Summary statistics
     print(f"\n=== County Statistics Summary ===")
-    print(f"Counties in data: {len(county_groups)}")
+    print(f"Counties in data: {len(county_sizes)}")
     print(f"Counties matching standard list: {len(matched_counties)}")
     print(f"Counties with data issues: {len(unmatched_counties)}")
     print(f"Counties with bad data: {unmatched_counties}")
@@ -183,19 +182,30 @@ def add_county_rankings(applicants):
 
     if len(matched_counties) == 47:
         print("✅ SUCCESS: All 47 expected counties are present and matched!")
-    elif len(county_groups) == 47:
+    elif len(county_sizes) == 47:
         print("⚠️  WARNING: 47 counties found but some names don't match standardized list")
     else:
-        print(f"❌ ERROR: Expected 47 counties, but found {len(county_groups)}")
+        print(f"❌ ERROR: Expected 47 counties, but found {len(county_sizes)}")
 
     return applicants
 
-def extract_applicants_data(csv_file_path):
+# Known malformed row start in the exported CSVs and its correction
+MALFORMED_ROW_PREFIX = "application_162_bundle.zip Applicant 162,Applicant_162"
+FIXED_ROW_PREFIX = "application_162_bundle.zip,Applicant_162"
+
+def extract_results_data(csv_file_path, score_column, ranking_column, min_columns):
     """
-    Extract applicant data from final results CSV file using proper CSV parsing.
+    Extract applicant data from a results CSV file using proper CSV parsing.
+
+    The final and first results exports share the same leading columns
+    (bundle, application ID, ..., county) and only differ in where the
+    weighted score and ranking sit relative to the end of each row.
 
     Args:
         csv_file_path (str): Path to the CSV file to process
+        score_column (int): Negative index of the weighted score column
+        ranking_column (int): Negative index of the ranking column
+        min_columns (int): Minimum row width that carries the scoring data
 
     Returns:
         list: List of dictionaries containing application_id, county, weighted_score, and ranking
@@ -206,109 +216,94 @@ def extract_applicants_data(csv_file_path):
         print(f"Error: CSV file not found at {csv_file_path}")
         return []
 
-    applicants = []
+    # Deduplicate by application_id as rows stream in (keep the last occurrence)
+    unique_applicants = {}
 
     try:
         with open(csv_file_path, 'r', encoding='utf-8') as file:
-            # Read all content first to handle multi-line quoted fields
-            content = file.read()
-
-            # Fix known malformed patterns before CSV parsing
-            content = content.replace("application_162_bundle.zip Applicant 162,Applicant_162", "application_162_bundle.zip,Applicant_162")
+            # Fix known malformed rows line by line while streaming; the
+            # csv reader still joins multi-line quoted fields across lines
+            lines = (
+                FIXED_ROW_PREFIX + line[len(MALFORMED_ROW_PREFIX):] if line.startswith(MALFORMED_ROW_PREFIX) else line
+                for line in file
+            )
 
             # Parse using proper CSV reader
-            import io
-            reader = csv.reader(io.StringIO(content))
-
-            rows = list(reader)
-            print(f"Read {len(rows)} total rows from CSV")
-
-        # Find data start row (look for first row with application_ pattern)
-        data_start_row = None
-        for i, row in enumerate(rows):
-            if len(row) > 0 and row[0].startswith('application_') and len(row) > 1 and 'Applicant_' in row[1]:
-                data_start_row = i
-                break
+            reader = csv.reader(lines)
+
+            total_rows = 0
+            data_start_row = None
+            processed_count = 0
+            skipped_count = 0
+
+            for row in reader:
+                total_rows += 1
+
+                # Find data start row (look for first row with application_ pattern)
+                if data_start_row is None:
+                    if len(row) > 0 and row[0].startswith('application_') and len(row) > 1 and 'Applicant_' in row[1]:
+                        data_start_row = total_rows - 1
+                    else:
+                        continue
+
+                # Skip empty rows or rows that don't start with application_
+                if len(row) < 4 or not row[0].startswith('application_'):
+                    continue
+
+                # Extract the fields we know (the width check above guarantees both exist)
+                application_id = row[1].strip()
+                county = row[3].strip()
+
+                # Skip only if application_id is missing (county can be fixed later)
+                if not application_id:
+                    skipped_count += 1
+                    continue
+
+                # If county is missing or problematic, try to fix it
+                if not county or county == 'N/A':
+                    county = 'Unknown'
+
+                weighted_score = 0.0
+                ranking = None
+
+                if len(row) >= min_columns:
+                    # Blank cells and spreadsheet errors (#N/A, #VALUE!, ...) are
+                    # settled without raising; only other junk reaches the except
+                    weighted_score_str = row[score_column].strip()
+                    if weighted_score_str and weighted_score_str[0] != '#':
+                        try:
+                            weighted_score = float(weighted_score_str)
+                        except ValueError:
+                            weighted_score = 0.0
+
+                    ranking_str = row[ranking_column].strip()
+                    if ranking_str and ranking_str[0] != '#':
+                        try:
+                            ranking = int(ranking_str)
+                        except ValueError:
+                            ranking = None
+
+                unique_applicants[application_id] = {
+                    "application_id": application_id,
+                    "county": county,
+                    "weighted_score": weighted_score,
+                    "ranking": ranking
+                }
+                processed_count += 1
+
+        print(f"Read {total_rows} total rows from CSV")
 
         if data_start_row is None:
             print("Error: Could not find data start row")
             return []
 
         print(f"Found data starting at row {data_start_row + 1}")
-
-        # Process each data row
-        processed_count = 0
-        skipped_count = 0
-
-        for row_num in range(data_start_row, len(rows)):
-            row = rows[row_num]
-
-            # Skip empty rows or rows that don't start with application_
-            if not row or len(row) < 4 or not row[0].startswith('application_'):
-                continue
-
-            # Extract the fields we know
-            try:
-                application_id = row[1].strip() if len(row) > 1 else ""
-                county = row[3].strip() if len(row) > 3 else ""
-            except:
-                skipped_count += 1
-                continue
-
-            # Skip only if application_id is missing (county can be fixed later)
-            if not application_id:
-                skipped_count += 1
-                continue
-
-            # If county is missing or problematic, try to fix it
-            if not county or county in ['N/A', '']:
-                county = 'Unknown'
-
-            # Based on the actual CSV structure:
-            # ..., TOTAL, Penalty Points, Sum of weighted scores - Penalty(if any), Ranking from composite score, Evaluator's Name, (empty)
-            # Example: [..., 46, 5, 41, 474, , ]
-            # So: weighted_score is at row[-4] and ranking is at row[-3]
-
-            weighted_score = 0.0
-            ranking = None
-
-            # Get the columns from the end
-            if len(row) >= 6:  # Need at least 6 columns to have the scoring data
-                try:
-                    # Sum of weighted scores is 4th from the end (row[-4])
-                    weighted_score_str = row[-4].strip() if len(row) >= 4 and row[-4] else ""
-                    weighted_score = float(weighted_score_str) if weighted_score_str and weighted_score_str != '#N/A' else 0.0
-                except:
-                    weighted_score = 0.0
-
-                try:
-                    # Ranking is 3rd from the end (row[-3])
-                    ranking_str = row[-3].strip() if len(row) >= 3 and row[-3] else ""
-                    ranking = int(ranking_str) if ranking_str and ranking_str != '#N/A' else None
-                except:
-                    ranking = None
-
-            applicant_data = {
-                "application_id": application_id,
-                "county": county,
-                "weighted_score": weighted_score,
-                "ranking": ranking
-            }
-
-            applicants.append(applicant_data)
-            processed_count += 1
-
         print(f"Processed {processed_count} records, skipped {skipped_count} invalid records")
 
-        # Deduplicate by application_id (keep the last occurrence)
-        unique_applicants = {}
-        for applicant in applicants:
-            unique_applicants[applicant['application_id']] = applicant
-
         deduplicated_applicants = list(unique_applicants.values())
 
-        if len(applicants) != len(deduplicated_applicants):
-            print(f"⚠️  Removed {len(applicants) - len(deduplicated_applicants)} duplicate records")
+        if processed_count != len(deduplicated_applicants):
+            print(f"⚠️  Removed {processed_count - len(deduplicated_applicants)} duplicate records")
 
         print(f"Successfully extracted {len(deduplicated_applicants)} applicants")
         return deduplicated_applicants
@@ -319,134 +314,38 @@ def extract_applicants_data(csv_file_path):
         traceback.print_exc()
         return []
 
-def extract_first_results_data(csv_file_path):
+def extract_applicants_data(csv_file_path):
     """
-    Extract applicant data from first results CSV file using proper CSV parsing.
+    Extract applicant data from final results CSV file using proper CSV parsing.
 
     Args:
-        csv_file_path (str): Path to the first results CSV file to process
+        csv_file_path (str): Path to the CSV file to process
 
     Returns:
         list: List of dictionaries containing application_id, county, weighted_score, and ranking
     """
+    # Based on the actual CSV structure:
+    # ..., TOTAL, Penalty Points, Sum of weighted scores - Penalty(if any), Ranking from composite score, Evaluator's Name, (empty)
+    # Example: [..., 46, 5, 41, 474, , ]
+    # So: weighted_score is at row[-4] and ranking is at row[-3]
+    # Need at least 6 columns to have the scoring data
+    return extract_results_data(csv_file_path, score_column=-4, ranking_column=-3, min_columns=6)
 
-    # Check if file exists
-    if not os.path.exists(csv_file_path):
-        print(f"Error: CSV file not found at {csv_file_path}")
-        return []
-
-    applicants = []
-
-    try:
-        with open(csv_file_path, 'r', encoding='utf-8') as file:
-            # Read all content first to handle multi-line quoted fields
-            content = file.read()
-
-            # Fix known malformed patterns before CSV parsing
-            content = content.replace("application_162_bundle.zip Applicant 162,Applicant_162", "application_162_bundle.zip,Applicant_162")
-
-            # Parse using proper CSV reader
-            import io
-            reader = csv.reader(io.StringIO(content))
-
-            rows = list(reader)
-            print(f"Read {len(rows)} total rows from CSV")
-
-        # Find data start row (look for first row with application_ pattern)
-        data_start_row = None
-        for i, row in enumerate(rows):
-            if len(row) > 0 and row[0].startswith('application_') and len(row) > 1 and 'Applicant_' in row[1]:
-                data_start_row = i
-                break
-
-        if data_start_row is None:
-            print("Error: Could not find data start row")
-            return []
-
-        print(f"Found data starting at row {data_start_row + 1}")
-
-        # Process each data row
-        processed_count = 0
-        skipped_count = 0
-
-        for row_num in range(data_start_row, len(rows)):
-            row = rows[row_num]
-
-            # Skip empty rows or rows that don't start with application_
-            if not row or len(row) < 4 or not row[0].startswith('application_'):
-                continue
-
-            # Extract the fields we know
-            try:
-                application_id = row[1].strip() if len(row) > 1 else ""
-                county = row[3].strip() if len(row) > 3 else ""
-            except:
-                skipped_count += 1
-                continue
-
-            # Skip only if application_id is missing (county can be fixed later)
-            if not application_id:
-                skipped_count += 1
-                continue
-
-            # If county is missing or problematic, try to fix it
-            if not county or county in ['N/A', '']:
-                county = 'Unknown'
-
-            # For first results, the structure is different
-            # Looking at the sample: [...,46,5,41,151]
-            # Where: 46 = TOTAL, 5 = Penalty Points, 41 = Sum of weighted scores, 151 = Ranking
-            # So the last 4 columns are: TOTAL, Penalty Points, Sum of weighted scores, Ranking
-
-            weighted_score = 0.0
-            ranking = None
-
-            # Get the last 4 columns for the scoring data
-            if len(row) >= 4:
-                try:
-                    # Sum of weighted scores is 2nd to last column
-                    weighted_score_str = row[-2].strip() if len(row) >= 2 and row[-2] else ""
-                    weighted_score = float(weighted_score_str) if weighted_score_str and weighted_score_str != '#N/A' else 0.0
-                except:
-                    weighted_score = 0.0
-
-                try:
-                    # Ranking is last column
-                    ranking_str = row[-1].strip() if len(row) >= 1 and row[-1] else ""
-                    ranking = int(ranking_str) if ranking_str and ranking_str != '#N/A' else None
-                except:
-                    ranking = None
-
-            applicant_data = {
-                "application_id": application_id,
-                "county": county,
-                "weighted_score": weighted_score,
-                "ranking": ranking
-            }
-
-            applicants.append(applicant_data)
-            processed_count += 1
-
-        print(f"Processed {processed_count} records, skipped {skipped_count} invalid records")
-
-        # Deduplicate by application_id (keep the last occurrence)
-        unique_applicants = {}
-        for applicant in applicants:
-            unique_applicants[applicant['application_id']] = applicant
-
-        deduplicated_applicants = list(unique_applicants.values())
-
-        if len(applicants) != len(deduplicated_applicants):
-            print(f"⚠️  Removed {len(applicants) - len(deduplicated_applicants)} duplicate records")
+def extract_first_results_data(csv_file_path):
+    """
+    Extract applicant data from first results CSV file using proper CSV parsing.
 
-        print(f"Successfully extracted {len(deduplicated_applicants)} applicants")
-        return deduplicated_applicants
+    Args:
+        csv_file_path (str): Path to the first results CSV file to process
 
-    except Exception as e:
-        print(f"Error reading CSV file: {e}")
-        import traceback
-        traceback.print_exc()
-        return []
+    Returns:
+        list: List of dictionaries containing application_id, county, weighted_score, and ranking
+    """
+    # For first results, the structure is different
+    # Looking at the sample: [...,46,5,41,151]
+    # Where: 46 = TOTAL, 5 = Penalty Points, 41 = Sum of weighted scores, 151 = Ranking
+    # So the last 4 columns are: TOTAL, Penalty Points, Sum of weighted scores, Ranking
+    return extract_results_data(csv_file_path, score_column=-2, ranking_column=-1, min_columns=4)
 
 def save_json_output(applicants, output_file_path):
     """
@@ -455,16 +354,81 @@ def save_json_output(applicants, output_file_path):
     Args:
         applicants (list): List of applicant dictionaries
         output_file_path (str): Path to save the JSON file
+
+    Returns:
+        bool: True if the file was written
     """
     try:
-        with open(output_file_path, 'w', encoding='utf-8') as file:
-            json.dump(applicants, file, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            # Same layout as json.dump(indent=2, ensure_ascii=False), encoded in C
+            with open(output_file_path, 'wb') as file:
+                file.write(orjson.dumps(applicants, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_file_path, 'w', encoding='utf-8') as file:
+                json.dump(applicants, file, indent=2, ensure_ascii=False)
         print(f"JSON data saved to: {output_file_path}")
+        return True
     except Exception as e:
         print(f"Error saving JSON file: {e}")
+        return False
+
+@functools.lru_cache(maxsize=None)
+def baseline_code_version():
+    """Hash of this script and the county tables, so cached outputs are rebuilt when the extraction logic changes."""
+    digest = hashlib.sha256()
+    with open(os.path.abspath(__file__), 'rb') as file:
+        digest.update(file.read())
+    digest.update(repr(sorted(COUNTY_MAPPINGS.items())).encode('utf-8'))
+    digest.update(repr(sorted(OFFICIAL_COUNTIES)).encode('utf-8'))
+    return digest.hexdigest()
+
+def baseline_signature(input_csv):
+    """
+    Signature of an input CSV (hashed path, size and modification time) and of the code that
+    turns it into JSON, or None if the CSV is missing.
+    """
+    try:
+        stat = os.stat(input_csv)
+    except FileNotFoundError:
+        return None
+    path_hash = hashlib.sha256(os.path.abspath(input_csv).encode('utf-8')).hexdigest()
+    return f"{baseline_code_version()}|{path_hash}|{stat.st_size}|{stat.st_mtime_ns}"
+
+def baseline_signature_path(cache_folder, output_json_file):
+    """File in cache_folder holding the signature of the CSV the JSON output was built from."""
+    return os.path.join(cache_folder, f"{os.path.basename(output_json_file)}.sig")
+
+def load_cached_baseline(output_json_file):
+    """Read back a previously written baseline JSON, or None if it cannot be read."""
+    try:
+        with open(output_json_file, 'rb') as file:
+            content = file.read()
+        return orjson.loads(content) if orjson is not None else json.loads(content.decode('utf-8'))
+    except (OSError, ValueError):
+        return None
 
-def create_baseline(output_folder, input_csv, output_json_file):
-    """Main function to extract and save applicant data."""
+def create_baseline(output_folder, input_csv, output_json_file, cache_folder=None):
+    """
+    Main function to extract and save applicant data.
+    With a cache_folder, a CSV that is unchanged since output_json_file was written (by the same
+    code) is not extracted again; the summary is printed from the existing JSON instead.
+    """
+
+    signature_file = baseline_signature_path(cache_folder, output_json_file) if cache_folder else None
+    signature = baseline_signature(input_csv) if cache_folder else None
+
+    if signature and os.path.exists(output_json_file):
+        try:
+            with open(signature_file, 'r', encoding='utf-8') as file:
+                previous_signature = file.read()
+        except FileNotFoundError:
+            previous_signature = None
+        if previous_signature == signature:
+            applicants = load_cached_baseline(output_json_file)
+            if applicants is not None:
+                print(f"⏭️  {input_csv} unchanged since {output_json_file} was written. Skipping extraction.")
+                print_baseline_summary(applicants)
+                return
 
     print(f"Extracting applicant data from: {input_csv}")
 
@@ -489,45 +453,67 @@ def create_baseline(output_folder, input_csv, output_json_file):
     print("Calculating county rankings...")
     applicants = add_county_rankings(applicants)
 
-    # Save to JSON
-    save_json_output(applicants, output_json_file)
+    # Save to JSON, then record which CSV it was built from (outside the published folder)
+    if save_json_output(applicants, output_json_file) and signature:
+        os.makedirs(cache_folder, exist_ok=True)
+        with open(signature_file, 'w', encoding='utf-8') as file:
+            file.write(signature)
 
     # Display sample data
     # print("\nSample data (first 5 records):")
     # for i, applicant in enumerate(applicants[:5]):
     #     print(f"{i+1}. {applicant}")
 
+    print_baseline_summary(applicants)
+
+def print_baseline_summary(applicants):
+    """Print the applicant total and score statistics for a baseline."""
     print(f"\nTotal applicants extracted: {len(applicants)}")
 
-    # Also create a summary by county
+    # Also create a summary by county, collecting the score statistics in the same pass
     county_counts = {}
-    county_avg_scores = {}
+    county_score_totals = {}
+    scored_count = 0
+    score_total = 0.0
+    highest_score = None
+    lowest_score = None
     for applicant in applicants:
         county = applicant['county']
+        score = applicant['weighted_score']
         county_counts[county] = county_counts.get(county, 0) + 1
-        if county not in county_avg_scores:
-            county_avg_scores[county] = []
-        county_avg_scores[county].append(applicant['weighted_score'])
+        county_score_totals[county] = county_score_totals.get(county, 0) + score
+
+        if score > 0:
+            scored_count += 1
+            score_total += score
+            if highest_score is None or score > highest_score:
+                highest_score = score
+            if lowest_score is None or score < lowest_score:
+                lowest_score = score
 
     print(f"\nApplicants by county:")
     for county, count in sorted(county_counts.items()):
-        avg_score = sum(county_avg_scores[county]) / len(county_avg_scores[county]) if county_avg_scores[county] else 0
+        avg_score = county_score_totals[county] / count
         # print(f"  {county}: {count} applicants, avg score: {avg_score:.1f}")
 
     # Show score distribution
-    scores = [app['weighted_score'] for app in applicants if app['weighted_score'] > 0]
-    if scores:
+    if scored_count:
         print(f"\nScore statistics:")
-        print(f"  Total with scores: {len(scores)}")
-        print(f"  Average score: {sum(scores)/len(scores):.1f}")
-        print(f"  Highest score: {max(scores):.1f}")
-        print(f"  Lowest score: {min(scores):.1f}")
+        print(f"  Total with scores: {scored_count}")
+        print(f"  Average score: {score_total/scored_count:.1f}")
+        print(f"  Highest score: {highest_score:.1f}")
+        print(f"  Lowest score: {lowest_score:.1f}")
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Generate cohort-scoped baseline JSON files")
     parser.add_argument("--cohort", default="latest", help="Cohort output folder (e.g. latest, c1)")
     parser.add_argument("--final-csv", help="Optional path to final results CSV")
     parser.add_argument("--first-csv", help="Optional path to first results CSV")
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Rebuild every baseline JSON even if its input CSV is unchanged since the last run",
+    )
     args = parser.parse_args()
 
     base_dir = os.getcwd()
@@ -558,14 +544,17 @@ if __name__ == "__main__":
     output_json_first_result = os.path.join(output_folder, "baseline-first-results.json")
     output_json_final_result = os.path.join(output_folder, "baseline-final-results.json")
 
+    # Cache signatures stay out of ui/public so they are never published with the JSON
+    cache_folder = None if args.no_cache else os.path.join(base_dir, "output", ".baseline_cache", args.cohort)
+
     # Extract data from CSV and save it as JSON
     if input_final_results:
-        create_baseline(output_folder, input_final_results, output_json_final_result)
+        create_baseline(output_folder, input_final_results, output_json_final_result, cache_folder=cache_folder)
     else:
         print("❌ No final results CSV found. Skipping baseline-final-results.json generation.")
 
     if input_first_results:
-        create_baseline(output_folder, input_first_results, output_json_first_result)
+        create_baseline(output_folder, input_first_results, output_json_first_result, cache_folder=cache_folder)
     else:
         print("⚠️  No first results CSV found. Skipping baseline-first-results.json generation.")
 
@@ -10,11 +10,41 @@ first and final results data.
 import json
 import os
 import argparse
-from collections import defaultdict
+from collections import Counter
+from operator import itemgetter
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# ui/public under the project root, resolved once from this script's location
+PUBLIC_DIR = Path(os.path.abspath(__file__)).parents[2] / 'ui' / 'public'
+
+# Field order of every record in baseline-combined.json
+EMPTY_COMBINED_RECORD = {
+    'application_id': None,
+    'county': None,
+    'first_weighted_score': None,
+    'first_ranking': None,
+    'first_county_rank': None,
+    'final_weighted_score': None,
+    'final_ranking': None,
+    'final_county_rank': None
+}
 
 def load_json_file(filepath):
     """Load JSON data from file."""
     try:
+        if orjson is not None:
+            with open(filepath, 'rb') as f:
+                content = f.read()
+            try:
+                return orjson.loads(content)
+            except orjson.JSONDecodeError:
+                # Older stdlib-written files may hold NaN/Infinity, which orjson rejects
+                return json.loads(content)
         with open(filepath, 'r', encoding='utf-8') as f:
             return json.load(f)
     except FileNotFoundError:
@@ -28,13 +58,11 @@ def combine_baseline_files(cohort: str = 'latest'):
     """Combine first and final results into a single file."""
 
     # Define file paths
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    project_root = os.path.dirname(os.path.dirname(script_dir))
-    output_dir = os.path.join(project_root, 'ui', 'public', cohort)
+    output_dir = PUBLIC_DIR / cohort
 
-    first_results_path = os.path.join(output_dir, 'baseline-first-results.json')
-    final_results_path = os.path.join(output_dir, 'baseline-final-results.json')
-    combined_output_path = os.path.join(output_dir, 'baseline-combined.json')
+    first_results_path = output_dir / 'baseline-first-results.json'
+    final_results_path = output_dir / 'baseline-final-results.json'
+    combined_output_path = output_dir / 'baseline-combined.json'
 
     print(f"Loading first results from: {first_results_path}")
     first_results = load_json_file(first_results_path)
@@ -46,52 +74,41 @@ def combine_baseline_files(cohort: str = 'latest'):
         print("Error: No data loaded from either file.")
         return
 
-    # Create a dictionary to store combined data by application_id
-    combined_data = {}
-
-    # Add first results data
-    for record in first_results:
-        app_id = record['application_id']
-        combined_data[app_id] = {
-            'application_id': app_id,
+    # Index each file by application_id, keeping only its own fields
+    first_map = {
+        record['application_id']: {
             'county': record['county'],
             'first_weighted_score': record['weighted_score'],
             'first_ranking': record['ranking'],
-            'first_county_rank': record.get('county_rank', None),
-            'final_weighted_score': None,
-            'final_ranking': None,
-            'final_county_rank': None
+            'first_county_rank': record.get('county_rank', None)
+        }
+        for record in first_results
+    }
+    final_map = {
+        record['application_id']: {
+            'county': record['county'],
+            'final_weighted_score': record['weighted_score'],
+            'final_ranking': record['ranking'],
+            'final_county_rank': record.get('county_rank', None)
         }
+        for record in final_results
+    }
 
-    # Add final results data (merge with existing or create new)
-    for record in final_results:
-        app_id = record['application_id']
-        if app_id in combined_data:
-            # Update existing record with final results
-            combined_data[app_id]['final_weighted_score'] = record['weighted_score']
-            combined_data[app_id]['final_ranking'] = record['ranking']
-            combined_data[app_id]['final_county_rank'] = record.get('county_rank', None)
-        else:
-            # Create new record for applicants only in final results
-            combined_data[app_id] = {
-                'application_id': app_id,
-                'county': record['county'],
-                'first_weighted_score': None,
-                'first_ranking': None,
-                'first_county_rank': None,
-                'final_weighted_score': record['weighted_score'],
-                'final_ranking': record['ranking'],
-                'final_county_rank': record.get('county_rank', None)
-            }
-
-    # Convert to list and sort by application_id for consistency
-    combined_list = list(combined_data.values())
-    combined_list.sort(key=lambda x: x['application_id'])
+    # Merge both onto an all-null record, sorted by application_id for consistency.
+    # First results are merged last so their county wins when both files have it.
+    combined_list = [
+        {**EMPTY_COMBINED_RECORD, 'application_id': app_id, **final_map.get(app_id, {}), **first_map.get(app_id, {})}
+        for app_id in sorted(first_map.keys() | final_map.keys())
+    ]
 
     # Save combined data
     try:
-        with open(combined_output_path, 'w', encoding='utf-8') as f:
-            json.dump(combined_list, f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            with open(combined_output_path, 'wb') as f:
+                f.write(orjson.dumps(combined_list, option=orjson.OPT_INDENT_2))
+        else:
+            with open(combined_output_path, 'w', encoding='utf-8') as f:
+                json.dump(combined_list, f, indent=2, ensure_ascii=False)
         print(f"Combined data saved to: {combined_output_path}")
     except Exception as e:
         print(f"Error saving combined file: {e}")
@@ -101,16 +118,19 @@ def combine_baseline_files(cohort: str = 'latest'):
     print(f"\nCombination Statistics:")
     print(f"Total unique applicants: {len(combined_list)}")
 
-    # Count applicants by data availability
-    both_results = sum(1 for record in combined_list
-                      if record['first_weighted_score'] is not None
-                      and record['final_weighted_score'] is not None)
-    only_first = sum(1 for record in combined_list
-                    if record['first_weighted_score'] is not None
-                    and record['final_weighted_score'] is None)
-    only_final = sum(1 for record in combined_list
-                    if record['first_weighted_score'] is None
-                    and record['final_weighted_score'] is not None)
+    # Count applicants by data availability in a single pass
+    both_results = 0
+    only_first = 0
+    only_final = 0
+    for record in combined_list:
+        has_first = record['first_weighted_score'] is not None
+        has_final = record['final_weighted_score'] is not None
+        if has_first and has_final:
+            both_results += 1
+        elif has_first:
+            only_first += 1
+        elif has_final:
+            only_final += 1
 
     print(f"Applicants with both first and final results: {both_results}")
     print(f"Applicants with only first results: {only_first}")
@@ -121,10 +141,8 @@ def combine_baseline_files(cohort: str = 'latest'):
     # for i, record in enumerate(combined_list[:5], 1):
     #     print(f"{i}. {record}")
 
-    # County distribution
-    county_counts = defaultdict(int)
-    for record in combined_list:
-        county_counts[record['county']] += 1
+    # County distribution (Counter tallies the mapped keys in C)
+    county_counts = Counter(map(itemgetter('county'), combined_list))
 
     # print(f"\nApplicants by county:")
     # for county, count in sorted(county_counts.items()):
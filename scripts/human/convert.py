@@ -5,25 +5,13 @@ import numpy as np
 import argparse
 from path_utils import resolve_csv_path
 
-def sanitize_value(v):
-    # Convert pandas/Numpy types and NaN/Inf to JSON-serializable Python types
-    try:
-        if v is None:
-            return None
-        # pandas uses numpy.nan for missing values
-        if isinstance(v, float) and (np.isnan(v) or np.isinf(v)):
-            return None
-        # numpy scalar types
-        if isinstance(v, (np.integer, np.floating, np.bool_)):
-            return v.item()
-        # numpy arrays (shouldn't normally appear) -> convert to list
-        if isinstance(v, np.ndarray):
-            return v.tolist()
-        # For other objects (strings, ints, etc.) just return as-is
-        return v
-    except Exception:
-        # Fallback to string representation if unexpected type
-        return str(v)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# infer_dtype results for columns that contain at least some strings
+TEXT_INFERRED_TYPES = ('string', 'mixed', 'mixed-integer')
 
 def extract_csv_to_json(file_path, output_path):
     """
@@ -41,18 +29,6 @@ def extract_csv_to_json(file_path, output_path):
         df = df.iloc[:, :-1]
 
         # --- normalize mapping/ county names ---
-        def normalize_county_name(x):
-            if x is None:
-                return None
-            s = str(x)
-            # replace hyphens with space
-            s = s.replace('-', ' ')
-            # remove trailing periods and trailing/leading whitespace
-            s = s.strip().rstrip('.')
-            # collapse multiple spaces into one
-            s = ' '.join(s.split())
-            return s.upper()
-
         # find a column named "mapping" (case-insensitive) or any column containing 'mapping'
         mapping_col = None
         for col in df.columns:
@@ -61,11 +37,35 @@ def extract_csv_to_json(file_path, output_path):
                 break
 
         if mapping_col:
-            df[mapping_col] = df[mapping_col].apply(lambda v: normalize_county_name(v) if pd.notnull(v) else v)
+            # County names repeat across many rows, so normalize each distinct value once:
+            # replace hyphens with space, remove trailing periods and surrounding whitespace,
+            # collapse runs of whitespace, uppercase. Missing values are left as they are.
+            mapping_values = df[mapping_col]
+            distinct_values = mapping_values.dropna().unique()
+            if len(distinct_values):
+                normalized = (
+                    pd.Series(distinct_values).astype(str)
+                    .str.replace('-', ' ', regex=False)
+                    .str.strip()
+                    .str.rstrip('.')
+                    .str.split()
+                    .str.join(' ')
+                    .str.upper()
+                )
+                df[mapping_col] = mapping_values.map(dict(zip(distinct_values, normalized)))
         # --- end normalization ---
 
-        # Treat empty strings or whitespace-only cells as missing values
-        df = df.replace(r'^\s*$', np.nan, regex=True)
+        # Treat empty strings or whitespace-only cells, and +/-inf, as missing values.
+        # Only columns holding strings can have blank cells (object columns may hold
+        # only bools or numbers, which the .str accessor rejects); str.strip() removes
+        # exactly the characters \s matches, so this is the vectorized form of r'^\s*$'.
+        for col in df.columns:
+            values = df[col]
+            if pd.api.types.infer_dtype(values, skipna=True) in TEXT_INFERRED_TYPES:
+                blank = values.str.strip().eq('')
+                if blank.any():
+                    df[col] = values.mask(blank)
+        df = df.replace([np.inf, -np.inf], np.nan)
 
         # Drop rows that are entirely empty (after converting empty strings to NaN)
         df = df.dropna(how='all')
@@ -74,48 +74,37 @@ def extract_csv_to_json(file_path, output_path):
             print(f"❌ No data rows found in {file_path} after header/trim.")
             return
 
-        # Replace pandas/NaN values with None for JSON; ensures valid JSON (no NaN)
-        df = df.where(pd.notnull(df), None)
-
-        # Convert to records and sanitize numpy types
-        raw_records = df.to_dict(orient='records')
-        data = []
-        for rec in raw_records:
-            sanitized = {k: sanitize_value(v) for k, v in rec.items()}
-            data.append(sanitized)
-
-        # Remove records that are completely empty (all values are None or empty string)
-        def record_has_data(rec: dict) -> bool:
-            for v in rec.values():
-                if v is None:
-                    continue
-                if isinstance(v, str) and v.strip() == '':
-                    continue
-                return True
-            return False
-
-        data = [rec for rec in data if record_has_data(rec)]
-
         # Additionally skip records where the link to bundle is missing/null
-        before_len = len(data)
-        def has_link(rec: dict) -> bool:
-            link = rec.get('Link to application bundle')
-            # treat None or empty string as missing
-            if link is None:
-                return False
-            if isinstance(link, str) and link.strip() == '':
-                return False
-            return True
-
-        data = [rec for rec in data if has_link(rec)]
-        removed_count = before_len - len(data)
+        # (blank links were already turned into NaN above)
+        link_col = 'Link to application bundle'
+        if link_col in df.columns:
+            has_link = df[link_col].notna()
+        else:
+            has_link = pd.Series(False, index=df.index)
+        removed_count = int((~has_link).sum())
+        df = df[has_link]
         if removed_count > 0:
             print(f"Filtered out {removed_count} records with missing Link to application bundle")
 
-        # Write the JSON object to a file
+        # Replace pandas/NaN values with None for JSON; ensures valid JSON (no NaN).
+        # Casting the whole frame to object boxes numpy values into plain Python
+        # ints/floats/bools column by column, so the records need no per-cell sanitizing.
+        df = df.astype(object).where(df.notna(), None)
+
+        # Convert to records; the cells are already plain Python values, so zipping
+        # raw row tuples skips the per-cell boxing that to_dict(orient='records') does
+        columns = df.columns.tolist()
+        data = [dict(zip(columns, row)) for row in df.itertuples(index=False, name=None)]
+
+        # Serialize the whole payload first, then write it to the file in one call
+        # (orjson and the json fallback produce the same indent=2, UTF-8 output)
+        if orjson is not None:
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
         os.makedirs(os.path.dirname(output_path), exist_ok=True)
-        with open(output_path, 'w') as json_file:
-            json.dump(data, json_file, indent=4)
+        with open(output_path, 'wb') as json_file:
+            json_file.write(payload)
 
         print(f"✅ Successfully converted {file_path} to {output_path}.")
     except FileNotFoundError:
@@ -10,8 +10,27 @@ def load_json(path):
 
 
 def last_n_alnum(s, n=4):
-    chars = [c for c in str(s) if c.isalnum()]
-    return ''.join(chars[-n:]) if chars else ''
+    return ''.join(filter(str.isalnum, str(s)))[-n:]
+
+
+def build_id_indexes(llm_ids, n=4):
+    """
+    Index LLM application IDs for the three match strategies.
+
+    Returns the set of exact IDs, a dict from the last n characters to the
+    first ID ending with them, and a dict from every substring of up to n
+    characters to the first ID containing it.
+    """
+    exact = set(llm_ids)
+    by_last_n = {}
+    by_substring = {}
+    for aid in llm_ids:
+        if len(aid) >= n:
+            by_last_n.setdefault(aid[-n:], aid)
+        for size in range(1, n + 1):
+            for start in range(len(aid) - size + 1):
+                by_substring.setdefault(aid[start:start + size], aid)
+    return exact, by_last_n, by_substring
 
 
 def main():
@@ -27,6 +46,8 @@ def main():
 
     filtered = [h for h in humans if h.get('E2. County Mapping') == 'BARINGO']
 
+    exact_ids, ids_by_last4, ids_by_substring = build_id_indexes(llm_ids, 4)
+
     counts = {'exact': 0, 'last4_end': 0, 'suffix_in': 0}
     matched_map = {}
     unmatched = []
@@ -39,42 +60,26 @@ def main():
             unmatched.append(human_id)
             continue
 
-        matched = False
-
         # 1) exact match
-        for aid in llm_ids:
-            if aid == human_id:
-                counts['exact'] += 1
-                matched_map[human_id] = ('exact', aid)
-                matched = True
-                break
-        if matched:
+        if human_id in exact_ids:
+            counts['exact'] += 1
+            matched_map[human_id] = ('exact', human_id)
             continue
 
         # Prepare last-4 alnum
         last4 = last_n_alnum(human_id, 4)
-        if last4:
-            # 2) numeric ID match: last 4 of application_id equals last4
-            found = None
-            for aid in llm_ids:
-                if len(aid) >= 4 and aid[-4:] == last4:
-                    counts['last4_end'] += 1
-                    matched_map[human_id] = ('last4_end', aid)
-                    found = aid
-                    matched = True
-                    break
-            if matched:
-                continue
-
-            # 3) suffix fallback: last4 appears anywhere in application_id
-            for aid in llm_ids:
-                if last4 in aid:
-                    counts['suffix_in'] += 1
-                    matched_map[human_id] = ('suffix_in', aid)
-                    matched = True
-                    break
-
-        if not matched:
+
+        # 2) numeric ID match: last 4 of application_id equals last4
+        if last4 in ids_by_last4:
+            counts['last4_end'] += 1
+            matched_map[human_id] = ('last4_end', ids_by_last4[last4])
+
+        # 3) suffix fallback: last4 appears anywhere in application_id
+        elif last4 in ids_by_substring:
+            counts['suffix_in'] += 1
+            matched_map[human_id] = ('suffix_in', ids_by_substring[last4])
+
+        else:
             unmatched.append(human_id)
 
     # Print results
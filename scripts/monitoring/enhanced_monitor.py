@@ -3,11 +3,44 @@
 Real-time monitor for KJET financial evaluation progress
 """
 
-import json
 import time
 import os
+import sys
 from pathlib import Path
-from collections import defaultdict
+from collections import Counter, defaultdict
+from operator import itemgetter
+
+from monitor_utils import iter_county_dirs, iter_evaluation_files, load_evaluation
+
+# Overall results with their own counters; anything else is tallied as N/A
+RESULT_BUCKETS = {'PASS': 'pass', 'FAIL': 'fail'}
+
+# Evaluation file path -> ((mtime_ns, size), (result, score) or None), kept across polls
+EVALUATION_CACHE = {}
+
+def read_evaluation_summary(json_file):
+    """
+    Return (result, score) for one evaluation file entry, or None if it cannot be parsed.
+    Files are only re-read when their size or modification time changed since the last poll.
+    """
+    stat = json_file.stat()
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cached = EVALUATION_CACHE.get(json_file.path)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    try:
+        data = load_evaluation(json_file.path)
+        result = data.get('overall_assessment', {}).get('financial_evaluation', 'N/A')
+        score = data.get('primary_criteria_scores', {}).get('A3_2_financial_position', {}).get('score', 'N/A')
+        # Both values become tally keys, so unhashable ones count as unreadable
+        hash((result, score))
+        summary = (result, score)
+    except Exception:
+        summary = None
+
+    EVALUATION_CACHE[json_file.path] = (signature, summary)
+    return summary
 
 def get_progress_stats():
     results_dir = Path("/Users/geoff/Downloads/KJET/fin_results_enhanced")
@@ -21,47 +54,34 @@ def get_progress_stats():
         'fail_count': 0,
         'na_count': 0,
         'counties': defaultdict(lambda: {'total': 0, 'pass': 0, 'fail': 0, 'na': 0}),
-        'score_distribution': defaultdict(int)
+        'score_distribution': Counter()
     }
     
-    # Process each county
-    for county_dir in results_dir.iterdir():
-        if county_dir.is_dir() and not county_dir.name.startswith('.'):
-            county = county_dir.name
-            json_files = list(county_dir.glob("*_financial_evaluation.json"))
-            
-            for json_file in json_files:
-                try:
-                    with open(json_file, 'r') as f:
-                        data = json.load(f)
-                        
-                    # Get overall result
-                    result = data.get('overall_assessment', {}).get('financial_evaluation', 'N/A')
-                    score = data.get('primary_criteria_scores', {}).get('A3_2_financial_position', {}).get('score', 'N/A')
-                    
-                    # Update totals
-                    stats['total_files'] += 1
-                    stats['counties'][county]['total'] += 1
-                    
-                    # Update counts
-                    if result == 'PASS':
-                        stats['pass_count'] += 1
-                        stats['counties'][county]['pass'] += 1
-                    elif result == 'FAIL':
-                        stats['fail_count'] += 1
-                        stats['counties'][county]['fail'] += 1
-                    else:
-                        stats['na_count'] += 1
-                        stats['counties'][county]['na'] += 1
-                    
-                    # Score distribution
-                    if score != 'N/A':
-                        stats['score_distribution'][score] += 1
-                    else:
-                        stats['score_distribution']['N/A'] += 1
-                        
-                except Exception as e:
-                    continue
+    # Collect ((county, result), score) for every readable evaluation file
+    rows = []
+    for county_dir in iter_county_dirs(results_dir):
+        county = county_dir.name
+
+        for json_file in iter_evaluation_files(county_dir.path):
+            try:
+                # Get overall result and score (cached while the file is unchanged)
+                summary = read_evaluation_summary(json_file)
+            except Exception as e:
+                continue
+            if summary is not None:
+                result, score = summary
+                rows.append(((county, result), score))
+
+    # Tally counts per (county, result) pair, then fold them into the totals
+    stats['total_files'] = len(rows)
+    for (county, result), count in Counter(map(itemgetter(0), rows)).items():
+        bucket = RESULT_BUCKETS.get(result, 'na')
+        stats[f'{bucket}_count'] += count
+        stats['counties'][county]['total'] += count
+        stats['counties'][county][bucket] += count
+
+    # Score distribution
+    stats['score_distribution'].update(map(itemgetter(1), rows))
     
     return stats
 
@@ -109,14 +129,35 @@ def display_progress():
     print(f"\\n🕐 Last updated: {time.strftime('%H:%M:%S')}")
     print(f"{'='*80}")
 
+def supports_ansi_clear():
+    """Return True if the console understands ANSI escapes (enabling them on Windows 10+)."""
+    if os.name != 'nt':
+        return True
+    try:
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        mode = ctypes.c_uint32()
+        if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            return False
+        # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+        return bool(kernel32.SetConsoleMode(handle, mode.value | 0x0004))
+    except Exception:
+        return False
+
 def main():
     print("🚀 Starting KJET Financial Evaluation Monitor...")
     print("Press Ctrl+C to stop monitoring\\n")
+    use_ansi_clear = supports_ansi_clear()
     
     try:
         while True:
-            # Clear screen (works on most terminals)
-            os.system('clear' if os.name == 'posix' else 'cls')
+            # Clear screen with an escape sequence rather than spawning clear/cls each poll
+            if use_ansi_clear:
+                sys.stdout.write('\x1b[2J\x1b[H')
+                sys.stdout.flush()
+            else:
+                os.system('cls')
             
             display_progress()
             time.sleep(10)  # Update every 10 seconds
@@ -0,0 +1,37 @@
+"""
+Shared helpers for the KJET evaluation progress monitors
+"""
+
+import json
+import os
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def load_evaluation(json_file):
+    """Parse one evaluation JSON file with orjson when available, falling back to the stdlib parser."""
+    with open(json_file, 'rb') as f:
+        content = f.read()
+    if orjson is not None:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            # The stdlib parser also accepts NaN/Infinity
+            pass
+    return json.loads(content.decode('utf-8'))
+
+def iter_county_dirs(results_dir):
+    """Yield the visible county folders under results_dir as os.DirEntry objects."""
+    with os.scandir(results_dir) as entries:
+        for entry in entries:
+            if entry.is_dir() and not entry.name.startswith('.'):
+                yield entry
+
+def iter_evaluation_files(county_dir):
+    """Yield the *_financial_evaluation.json entries of one county folder."""
+    with os.scandir(county_dir) as entries:
+        for entry in entries:
+            if entry.name.endswith('_financial_evaluation.json'):
+                yield entry
@@ -3,11 +3,12 @@
 Simple progress checker for KJET evaluation
 """
 
-import json
 import time
 from pathlib import Path
 from collections import defaultdict
 
+from monitor_utils import iter_county_dirs, iter_evaluation_files, load_evaluation
+
 def check_progress():
     """Check current progress"""
     results_dir = Path("/Users/geoff/Downloads/KJET/fin_results_optimized")
@@ -23,25 +24,23 @@ def check_progress():
     na_count = 0
     counties_processed = set()
     
-    for county_dir in results_dir.iterdir():
-        if county_dir.is_dir() and not county_dir.name.startswith('.'):
-            counties_processed.add(county_dir.name)
-            
-            for json_file in county_dir.glob("*_financial_evaluation.json"):
-                total += 1
-                try:
-                    with open(json_file, 'r') as f:
-                        data = json.load(f)
-                    
-                    result = data.get('overall_assessment', {}).get('financial_evaluation', 'N/A')
-                    if result == 'PASS':
-                        pass_count += 1
-                    elif result == 'FAIL':
-                        fail_count += 1
-                    else:
-                        na_count += 1
-                except:
-                    continue
+    for county_dir in iter_county_dirs(results_dir):
+        counties_processed.add(county_dir.name)
+
+        for json_file in iter_evaluation_files(county_dir.path):
+            total += 1
+            try:
+                data = load_evaluation(json_file.path)
+
+                result = data.get('overall_assessment', {}).get('financial_evaluation', 'N/A')
+                if result == 'PASS':
+                    pass_count += 1
+                elif result == 'FAIL':
+                    fail_count += 1
+                else:
+                    na_count += 1
+            except:
+                continue
     
     print(f"📊 Current Progress: {total} applications processed")
     print(f"   ✅ PASS: {pass_count} ({pass_count/max(total,1)*100:.1f}%)")